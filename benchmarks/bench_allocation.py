@@ -0,0 +1,28 @@
+"""TeamCoordinator task allocation benchmarks"""
+from typing import Any, Dict
+
+from . import stubs
+stubs.install()
+
+from src.core.coordination import TeamCoordinator
+from .harness import benchmark
+from .workloads import make_agent_status, make_tasks
+
+CAPABILITIES = [f"cap_{i}" for i in range(12)]
+
+PROFILES = {
+    "quick": {"agents": 50, "tasks": 500},
+    "full": {"agents": 200, "tasks": 5000},
+}
+
+
+@benchmark("coordination.optimize_task_allocation", profiles=PROFILES)
+async def optimize_task_allocation(params: Dict[str, Any]):
+    coordinator = TeamCoordinator("benchmark")
+    coordinator.agent_status = make_agent_status(params["agents"], CAPABILITIES)
+    tasks = make_tasks(params["tasks"], CAPABILITIES)
+
+    async def run():
+        await coordinator.optimize_task_allocation(tasks)
+
+    return run
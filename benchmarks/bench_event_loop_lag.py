@@ -0,0 +1,96 @@
+"""Event-loop lag benchmark for SystemMonitor resource probes
+Compares the legacy blocking get_resource_usage against the cached snapshot.
+
+Run from the repository root:
+    python -m benchmarks.bench_event_loop_lag
+"""
+from typing import Any, Callable, Dict, List
+import asyncio
+import statistics
+import time
+from datetime import datetime
+
+import psutil
+
+from src.utils.system_monitor import SystemMonitor
+
+TICK_INTERVAL = 0.01  # Heartbeat period used to detect loop stalls
+
+
+def legacy_get_resource_usage() -> Dict[str, Any]:
+    """Probe as implemented before snapshots were cached"""
+    return {
+        "cpu": {
+            "percent": psutil.cpu_percent(interval=1, percpu=True),
+            "count": psutil.cpu_count(),
+        },
+        "memory": dict(psutil.virtual_memory()._asdict()),
+        "disk": {"usage": dict(psutil.disk_usage('/')._asdict())},
+        "network": {
+            "io": dict(psutil.net_io_counters()._asdict()),
+            "connections": len(psutil.net_connections())
+        },
+        "timestamp": datetime.utcnow()
+    }
+
+
+async def _heartbeat(lags: List[float], stop: asyncio.Event):
+    """Record how late each tick wakes up relative to its schedule"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK_INTERVAL
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def measure(probe: Callable[[], Dict[str, Any]], calls: int, pause: float) -> Dict[str, float]:
+    """Call probe repeatedly on the loop while a heartbeat measures lag"""
+    lags: List[float] = []
+    latencies: List[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+
+    for _ in range(calls):
+        start = time.perf_counter()
+        probe()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(pause)
+
+    stop.set()
+    await heartbeat
+    lags.sort()
+    return {
+        "probe_mean_us": statistics.mean(latencies) * 1e6,
+        "probe_max_us": max(latencies) * 1e6,
+        "lag_p99_ms": lags[int(0.99 * (len(lags) - 1))] * 1e3,
+        "lag_max_ms": lags[-1] * 1e3,
+    }
+
+
+async def run(calls: int = 3, cached_calls: int = 2000) -> Dict[str, Dict[str, float]]:
+    """Measure event-loop lag with the blocking and cached probes"""
+    before = await measure(legacy_get_resource_usage, calls, pause=0.05)
+
+    monitor = SystemMonitor()
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.2)  # Let the first snapshot land
+        after = await measure(monitor.get_resource_usage, cached_calls, pause=0.001)
+    finally:
+        await monitor.stop()
+
+    return {"before": before, "after": after}
+
+
+def main():
+    results = asyncio.run(run())
+    for label, stats in results.items():
+        print(
+            f"{label:>6}: probe mean {stats['probe_mean_us']:>12.1f} us  "
+            f"max {stats['probe_max_us']:>12.1f} us  "
+            f"loop lag p99 {stats['lag_p99_ms']:>8.2f} ms  max {stats['lag_max_ms']:>8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
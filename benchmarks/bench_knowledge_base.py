@@ -0,0 +1,88 @@
+"""KnowledgeBase ingestion and retrieval benchmarks"""
+from typing import Any, Dict
+
+from . import stubs
+stubs.install()
+
+from src.core.knowledge_base import KnowledgeBase
+from .harness import benchmark
+from .workloads import make_corpus, make_id_queries, make_queries
+
+PROFILES = {
+    "quick": {"entries": 2000, "dimension": 256, "queries": 20},
+    "full": {"entries": 20000, "dimension": 768, "queries": 50},
+}
+
+
+async def build_knowledge_base(params: Dict[str, Any]) -> KnowledgeBase:
+    """Populate a KnowledgeBase with N synthetic entries of dimension D"""
+    kb = KnowledgeBase(embedding_dimension=params["dimension"])
+    kb._generate_embedding = stubs.HashEmbedder(params["dimension"])
+    for content, category in make_corpus(params["entries"]):
+        await kb.add_entry(content, category, source="benchmark")
+    return kb
+
+
+@benchmark("kb.add_entry", profiles=PROFILES, repeats=3)
+async def kb_add_entry(params: Dict[str, Any]):
+    corpus = make_corpus(params["entries"] // 4, seed=7)
+
+    async def run():
+        kb = KnowledgeBase(embedding_dimension=params["dimension"])
+        kb._generate_embedding = stubs.HashEmbedder(params["dimension"])
+        for content, category in corpus:
+            await kb.add_entry(content, category, source="benchmark")
+
+    return run
+
+
+@benchmark("kb.query", profiles=PROFILES)
+async def kb_query(params: Dict[str, Any]):
+    kb = await build_knowledge_base(params)
+    queries = make_queries(make_corpus(params["entries"]), params["queries"])
+
+    async def run():
+        for query in queries:
+            await kb.query(query, top_k=5)
+
+    return run
+
+
+@benchmark("kb.query.lexical", profiles=PROFILES)
+async def kb_query_lexical(params: Dict[str, Any]):
+    kb = await build_knowledge_base(params)
+    queries = [q for q, _ in make_id_queries(params["entries"], params["queries"])]
+
+    async def run():
+        for query in queries:
+            await kb.query(query, top_k=5, mode="lexical")
+
+    return run
+
+
+@benchmark("kb.query.hybrid", profiles=PROFILES)
+async def kb_query_hybrid(params: Dict[str, Any]):
+    kb = await build_knowledge_base(params)
+    queries = make_queries(make_corpus(params["entries"]), params["queries"])
+
+    async def run():
+        for query in queries:
+            await kb.query(query, top_k=5, mode="hybrid")
+
+    return run
+
+
+@benchmark("kb.churn", profiles=PROFILES, repeats=3)
+async def kb_churn(params: Dict[str, Any]):
+    """Delete a quarter of the entries, compact, then add them back"""
+    kb = await build_knowledge_base(params)
+
+    async def run():
+        victims = list(kb.entries.values())[: params["entries"] // 4]
+        for entry in victims:
+            await kb.delete_entry(entry.id)
+        await kb.compact()
+        for entry in victims:
+            await kb.add_entry(entry.content, entry.category, source=entry.source)
+
+    return run
@@ -0,0 +1,78 @@
+"""Latency and quality of vector, lexical and hybrid KnowledgeBase retrieval
+on a synthetic corpus.
+
+Two query sets are used:
+    id     - exact identifiers (ERR-000123) that name exactly one entry
+    phrase - the first words of an entry's content
+
+Quality is recall@k of the entry the query was drawn from. The offline
+embedder is a bag of hashed word vectors, so vector scores track word
+overlap rather than meaning.
+
+Run from the repository root:
+    python -m benchmarks.bench_retrieval --entries 5000 --dimension 384
+"""
+from typing import Any, Dict, List, Tuple
+import argparse
+import asyncio
+import time
+
+from . import stubs
+stubs.install()
+
+from .bench_knowledge_base import build_knowledge_base
+from .workloads import make_corpus, make_id_queries
+
+MODES = ("vector", "lexical", "hybrid")
+
+
+def _phrase_queries(corpus: List[Tuple[str, str]], n_queries: int) -> List[Tuple[str, int]]:
+    step = max(1, len(corpus) // n_queries)
+    return [(" ".join(corpus[i][0].split()[:6]), i) for i in range(0, len(corpus), step)][:n_queries]
+
+
+async def evaluate(params: Dict[str, Any], top_k: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    kb = await build_knowledge_base(params)
+    corpus = make_corpus(params["entries"])
+    entry_ids = list(kb.entries)  # Insertion order matches corpus order
+
+    query_sets = {
+        "id": make_id_queries(params["entries"], params["queries"]),
+        "phrase": _phrase_queries(corpus, params["queries"]),
+    }
+
+    report: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for set_name, queries in query_sets.items():
+        report[set_name] = {}
+        for mode in MODES:
+            hits = 0
+            start = time.perf_counter()
+            for query, target in queries:
+                results = await kb.query(query, top_k=top_k, mode=mode)
+                hits += any(r["id"] == entry_ids[target] for r in results)
+            elapsed = time.perf_counter() - start
+            report[set_name][mode] = {
+                "latency_ms": elapsed / len(queries) * 1e3,
+                "recall": hits / len(queries),
+            }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare KnowledgeBase retrieval modes")
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    params = {"entries": args.entries, "dimension": args.dimension, "queries": args.queries}
+    report = asyncio.run(evaluate(params, args.top_k))
+    for set_name, modes in report.items():
+        print(f"{set_name} queries:")
+        for mode, stats in modes.items():
+            print(f"  {mode:>8}: {stats['latency_ms']:8.3f} ms/query  recall@{args.top_k} {stats['recall']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
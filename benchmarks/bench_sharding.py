@@ -0,0 +1,100 @@
+"""Throughput scaling of ShardedAgentTeam with the number of worker processes
+Members are CPU-bound stub agents, so a single-process team is limited to one core.
+
+Run from the repository root:
+    python -m benchmarks.bench_sharding --tasks 200 --agents 8 --workers 1 2 4 8
+"""
+from typing import Any, Dict, List
+import argparse
+import asyncio
+import os
+import time
+from unittest import mock
+
+from . import stubs
+stubs.install()
+
+from src.core import team as team_module
+from src.core.admission import AdmissionConfig
+from src.core.sharding import ShardConfig, ShardedAgentTeam
+from src.core.team import AgentTeam, TeamConfig
+from .bench_team import _drain
+
+
+def _team_config(agents: int, tasks: int) -> TeamConfig:
+    return TeamConfig(
+        name="benchmark",
+        coordinator_agent="coordinator",
+        member_agents=[f"agent_{i}" for i in range(agents)],
+        collaboration_mode="parallel",
+        admission=AdmissionConfig(
+            queue_low_watermark=tasks,
+            queue_high_watermark=2 * tasks,
+            max_queue_depth=2 * tasks + 1,
+            use_host_metrics=False,  # CPU-bound agents would otherwise trip CPU admission
+        ),
+    )
+
+
+async def run_in_process(agents: int, tasks: int, queue_workers: int) -> float:
+    """Tasks per second with every agent on this process's event loop"""
+    with mock.patch.object(team_module, "Agent", stubs.make_cpu_bound_agent):
+        team = AgentTeam(_team_config(agents, tasks))
+
+    start = time.perf_counter()
+    await _drain(team, tasks, queue_workers)
+    return tasks / (time.perf_counter() - start)
+
+
+async def run_sharded(agents: int, tasks: int, queue_workers: int, workers: int) -> Dict[str, Any]:
+    """Tasks per second with agents spread over `workers` processes"""
+    team = ShardedAgentTeam(
+        _team_config(agents, tasks),
+        ShardConfig(
+            workers=workers,
+            # Fork so worker processes inherit the stubs installed above
+            start_method="fork",
+            agent_factory=stubs.make_cpu_bound_agent,
+        ),
+    )
+    await team.start()
+    try:
+        await _drain(team, max(1, tasks // 10), queue_workers)  # Warm up
+        start = time.perf_counter()
+        await _drain(team, tasks, queue_workers)
+        throughput = tasks / (time.perf_counter() - start)
+        completed = {shard: s["completed"] for shard, s in team.shard_status().items()}
+    finally:
+        await team.stop()
+    return {"throughput": throughput, "completed_per_shard": completed}
+
+
+async def run(agents: int, tasks: int, queue_workers: int, worker_counts: List[int]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"in_process": await run_in_process(agents, tasks, queue_workers)}
+    for workers in worker_counts:
+        results[f"sharded_{workers}"] = await run_sharded(agents, tasks, queue_workers, workers)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--queue-workers", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.agents, args.tasks, args.queue_workers, args.workers))
+    baseline = results["in_process"]
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'in_process':>12}: {baseline:8.1f} tasks/s  1.00x")
+    for workers in args.workers:
+        result = results[f"sharded_{workers}"]
+        print(
+            f"{'sharded_' + str(workers):>12}: {result['throughput']:8.1f} tasks/s  "
+            f"{result['throughput'] / baseline:.2f}x  per-shard {result['completed_per_shard']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
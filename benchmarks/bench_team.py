@@ -0,0 +1,75 @@
+"""AgentTeam end-to-end throughput benchmarks"""
+from typing import Any, Dict
+import asyncio
+from unittest import mock
+
+from . import stubs
+stubs.install()
+
+from src.core import team as team_module
+from src.core.admission import AdmissionConfig
+from src.core.team import AgentTeam, TeamConfig
+from .harness import benchmark
+
+PROFILES = {
+    "quick": {"agents": 4, "tasks": 200, "workers": 5, "median_latency": 0.002},
+    "full": {"agents": 16, "tasks": 2000, "workers": 20, "median_latency": 0.002},
+}
+
+
+def build_team(params: Dict[str, Any], mode: str) -> AgentTeam:
+    """Create a team whose coordinator and members are StubAgents"""
+    n_tasks = params["tasks"]
+    config = TeamConfig(
+        name="benchmark",
+        coordinator_agent="coordinator",
+        member_agents=[f"agent_{i}" for i in range(params["agents"])],
+        max_concurrent_tasks=params["workers"],
+        collaboration_mode=mode,
+        admission=AdmissionConfig(
+            queue_low_watermark=n_tasks,
+            queue_high_watermark=2 * n_tasks,
+            max_queue_depth=2 * n_tasks + 1,
+            use_host_metrics=False,  # Measure the team, not the host's load
+        ),
+    )
+
+    def make_agent(agent_config):
+        return stubs.StubAgent(agent_config, median_latency=params["median_latency"])
+
+    with mock.patch.object(team_module, "Agent", make_agent):
+        return AgentTeam(config)
+
+
+async def _drain(team: AgentTeam, n_tasks: int, workers: int):
+    """Assign n_tasks and wait until the team has completed all of them"""
+    team.active_tasks.clear()
+    runners = [asyncio.create_task(team.execute_tasks()) for _ in range(workers)]
+    try:
+        for i in range(n_tasks):
+            await team.assign_task({"task": "execute", "parameters": {"n": i}})
+        await team.task_queue.join()
+    finally:
+        for runner in runners:
+            runner.cancel()
+        await asyncio.gather(*runners, return_exceptions=True)
+
+
+@benchmark("team.throughput.parallel", profiles=PROFILES, repeats=3)
+async def team_parallel(params: Dict[str, Any]):
+    team = build_team(params, "parallel")
+
+    async def run():
+        await _drain(team, params["tasks"], params["workers"])
+
+    return run
+
+
+@benchmark("team.throughput.sequential", profiles=PROFILES, repeats=3)
+async def team_sequential(params: Dict[str, Any]):
+    team = build_team(params, "sequential")
+
+    async def run():
+        await _drain(team, params["tasks"], params["workers"])
+
+    return run
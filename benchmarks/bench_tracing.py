@@ -0,0 +1,42 @@
+"""Tracing overhead benchmarks"""
+from typing import Any, Dict
+
+from . import stubs
+stubs.install()
+
+from src.utils.monitoring import monitor
+from src.utils.tracing import tracer
+from .harness import benchmark
+
+PROFILES = {
+    "quick": {"calls": 20000},
+    "full": {"calls": 200000},
+}
+
+
+@monitor(name="benchmark.traced")
+async def _traced():
+    pass
+
+
+@benchmark("tracing.monitor_overhead", profiles=PROFILES)
+async def monitor_overhead(params: Dict[str, Any]):
+    """Nested monitored calls: one root span plus `calls` children"""
+
+    previous_rate = tracer.sample_rate
+
+    @monitor(name="benchmark.root")
+    async def root():
+        for _ in range(params["calls"]):
+            await _traced()
+
+    async def run():
+        tracer.reset()
+        # Each run is one trace, so sampling it or not must not vary per run
+        tracer.configure(sample_rate=1.0)
+        try:
+            await root()
+        finally:
+            tracer.configure(sample_rate=previous_rate)
+
+    return run
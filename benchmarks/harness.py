@@ -0,0 +1,79 @@
+"""Benchmark registry and timing harness"""
+from typing import Any, Awaitable, Callable, Dict, List
+from dataclasses import dataclass, field
+import asyncio
+import gc
+import statistics
+import time
+
+# setup(params) -> coroutine function timed once per repeat
+Setup = Callable[[Dict[str, Any]], Awaitable[Callable[[], Awaitable[Any]]]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Setup
+    profiles: Dict[str, Dict[str, Any]]
+    repeats: int = 5
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, profiles: Dict[str, Dict[str, Any]], repeats: int = 5):
+    """Register a benchmark
+
+    The decorated coroutine receives the profile's parameters, performs
+    any untimed setup, and returns the coroutine function to be timed.
+    """
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = Benchmark(name, setup, profiles, repeats)
+        return setup
+    return decorator
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    params: Dict[str, Any]
+    timings: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        timings = sorted(self.timings)
+        return {
+            "params": self.params,
+            "repeats": len(timings),
+            "median_s": statistics.median(timings),
+            "min_s": timings[0],
+            "p95_s": timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))],
+        }
+
+
+async def run_benchmark(bench: Benchmark, profile: str) -> BenchmarkResult:
+    """Set up once, warm up once, then time each repeat"""
+    params = bench.profiles[profile]
+    run = await bench.setup(dict(params))
+    await run()
+
+    result = BenchmarkResult(bench.name, params)
+    for _ in range(bench.repeats):
+        # Start each repeat from a clean heap so garbage left by earlier
+        # benchmarks in this process is not collected on our clock
+        gc.collect()
+        start = time.perf_counter()
+        await run()
+        result.timings.append(time.perf_counter() - start)
+    return result
+
+
+def run_all(profile: str, name_filter: str = "") -> Dict[str, Dict[str, Any]]:
+    """Run every registered benchmark matching name_filter"""
+    results = {}
+    for name, bench in sorted(BENCHMARKS.items()):
+        if name_filter and name_filter not in name:
+            continue
+        if profile not in bench.profiles:
+            continue
+        results[name] = asyncio.run(run_benchmark(bench, profile)).to_dict()
+    return results
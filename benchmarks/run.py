@@ -0,0 +1,126 @@
+"""Benchmark runner for Agentic OS
+Runs the registered benchmarks, records results to JSON and fails on
+regressions against a stored baseline.
+
+Run from the repository root:
+    python -m benchmarks.run                      # compare with baseline
+    python -m benchmarks.run --update-baseline    # record a new baseline
+    python -m benchmarks.run --profile full --filter kb.
+
+Timings only compare on the same machine, so baselines are not
+committed: record one locally with --update-baseline before a change.
+CI benchmarks the base revision and then the head on the same runner
+(see .github/workflows/ci.yml) and fails the build when a benchmark's
+best time regresses past the threshold.
+"""
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from . import bench_allocation, bench_knowledge_base, bench_team, bench_tracing  # noqa: F401  (registers benchmarks)
+from .harness import run_all
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+    min_delta: float = 0.0
+) -> List[str]:
+    """Return a message for every benchmark whose best time regressed past threshold
+
+    The minimum over repeats is compared because it is the least sensitive
+    to scheduler noise on shared machines. Slowdowns smaller than min_delta
+    seconds are ignored, since sub-millisecond benchmarks jitter by more
+    than any sensible ratio across runners.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"  {name}: no baseline")
+            continue
+        if previous.get("params") != current["params"]:
+            print(f"  {name}: baseline recorded with different parameters, skipped")
+            continue
+
+        ratio = current["min_s"] / previous["min_s"]
+        print(f"  {name}: {previous['min_s']:.4f}s -> {current['min_s']:.4f}s ({ratio:.2f}x)")
+        if ratio > 1.0 + threshold and current["min_s"] - previous["min_s"] > min_delta:
+            regressions.append(f"{name} is {ratio:.2f}x slower than baseline")
+    return regressions
+
+
+def _load(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _save(path: Path, document: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(document, fh, indent=2, sort_keys=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run Agentic OS benchmarks")
+    parser.add_argument("--profile", default="quick", help="workload size profile (quick|full)")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="allowed slowdown of the best time before failing (0.20 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=0.001,
+                        help="ignore slowdowns smaller than this many seconds")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="fail instead of skipping the comparison when no baseline exists")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.profile, args.filter)
+    document = {
+        "meta": {
+            "profile": args.profile,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+        "results": results,
+    }
+    _save(args.output, document)
+    for name, result in results.items():
+        print(f"{name}: median {result['median_s']:.4f}s  min {result['min_s']:.4f}s")
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        baseline = _load(args.baseline) or {"results": {}}
+        baseline["meta"] = document["meta"]
+        baseline["results"].update(results)
+        _save(args.baseline, baseline)
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+
+    baseline = _load(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 1 if args.require_baseline else 0
+
+    print(f"Comparing against {args.baseline} (threshold {args.threshold:.0%})")
+    regressions = compare(results, baseline.get("results", {}), args.threshold, args.min_delta)
+    for message in regressions:
+        print(f"REGRESSION: {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Offline stubs for benchmarking Agentic OS
+Stands in for Memory, Pipeline, the embedder and member agents so the
+suite runs without models, network access or optional services."""
+from typing import Any, Dict, List, Optional
+import asyncio
+import importlib.util
+import sys
+import types
+import zlib
+
+import numpy as np
+
+
+class StubMemory:
+    """Bounded in-process memory"""
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.items: List[Any] = []
+
+    def initialize(self):
+        pass
+
+    def add(self, context: Any, result: Any):
+        self.items.append((context, result))
+        if len(self.items) > self.max_size:
+            self.items.pop(0)
+
+
+class StubPipeline:
+    """Pipeline that echoes its context back as the result"""
+
+    def __init__(self, threads: int = 4):
+        self.threads = threads
+
+    def initialize(self):
+        pass
+
+    async def process(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "success", "context": context}
+
+
+class _Error(Exception):
+    def __init__(self, message: str, code: str = "ERROR"):
+        super().__init__(message)
+        self.code = code
+
+
+def _handle_error(error: Exception, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"status": "error", "error": str(error), "code": getattr(error, "code", None)}
+
+
+def _monitor(func):
+    return func
+
+
+def _stub_module(name: str, **attrs: Any) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+_STUBS = {
+    "src.core.memory": lambda: _stub_module("src.core.memory", Memory=StubMemory),
+    "src.core.processing": lambda: _stub_module("src.core.processing", Pipeline=StubPipeline),
+    "src.utils.error_handling": lambda: _stub_module(
+        "src.utils.error_handling",
+        AgentError=type("AgentError", (_Error,), {}),
+        CapabilityError=type("CapabilityError", (_Error,), {}),
+        TeamError=type("TeamError", (Exception,), {}),
+        KnowledgeBaseError=type("KnowledgeBaseError", (Exception,), {}),
+        handle_error=_handle_error,
+    ),
+    "src.utils.monitoring": lambda: _stub_module("src.utils.monitoring", monitor=_monitor),
+}
+
+
+def install() -> List[str]:
+    """Register stubs for any supporting modules missing from this tree
+
+    Real modules always win; returns the names that were stubbed.
+    """
+    stubbed = []
+    for name, factory in _STUBS.items():
+        if name in sys.modules or importlib.util.find_spec(name) is not None:
+            continue
+        sys.modules[name] = factory()
+        stubbed.append(name)
+    return stubbed
+
+
+class HashEmbedder:
+    """Deterministic bag-of-words embedder
+
+    Each word maps to a fixed random vector and a text embeds as their sum,
+    so texts sharing words score as similar, as with a real model.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self._word_vectors: Dict[str, np.ndarray] = {}
+
+    def _word_vector(self, word: str) -> np.ndarray:
+        vector = self._word_vectors.get(word)
+        if vector is None:
+            rng = np.random.default_rng(zlib.crc32(word.encode("utf-8")))
+            vector = self._word_vectors[word] = rng.standard_normal(self.dimension)
+        return vector
+
+    async def __call__(self, text: str) -> np.ndarray:
+        embedding = np.zeros(self.dimension)
+        for word in text.lower().split():
+            embedding += self._word_vector(word)
+        return embedding if embedding.any() else self._word_vector(text)
+
+
+class StubAgent:
+    """Member agent whose processing time follows a log-normal distribution"""
+
+    def __init__(self, config: Any, median_latency: float = 0.002, sigma: float = 0.5, seed: Optional[int] = None):
+        self.name = getattr(config, "name", str(config))
+        self.median_latency = median_latency
+        self.sigma = sigma
+        self._rng = np.random.default_rng(seed if seed is not None else zlib.crc32(self.name.encode("utf-8")))
+        self.processed = 0
+
+    async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        if input_data.get("task") == "plan_execution":
+            return {"execution_plan": self._plan(input_data["parameters"])}
+
+        await asyncio.sleep(self.median_latency * float(self._rng.lognormal(0.0, self.sigma)))
+        self.processed += 1
+        return {"status": "success", "agent": self.name}
+
+    def _plan(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """One subtask per available agent, as the coordinator would plan it"""
+        return {
+            "subtasks": [
+                {"task": "execute", "parameters": {"agent": agent_id}}
+                for agent_id in parameters["available_agents"]
+            ]
+        }
+
+
+class CpuBoundStubAgent(StubAgent):
+    """Member agent that spends its processing time on the CPU instead of sleeping"""
+
+    def __init__(self, config: Any, work_iterations: int = 20000):
+        super().__init__(config)
+        self.work_iterations = work_iterations
+
+    async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        if input_data.get("task") == "plan_execution":
+            return {"execution_plan": self._plan(input_data["parameters"])}
+
+        acc = 0
+        for i in range(self.work_iterations):
+            acc = (acc * 31 + i) % 1000003
+        self.processed += 1
+        return {"status": "success", "agent": self.name, "checksum": acc}
+
+
+def make_cpu_bound_agent(config: Any) -> CpuBoundStubAgent:
+    """Picklable agent factory for worker processes"""
+    return CpuBoundStubAgent(config)
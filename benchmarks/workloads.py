@@ -0,0 +1,69 @@
+"""Synthetic workload generators for the benchmark suite"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+_VOCABULARY_SIZE = 5000
+
+
+def make_corpus(n_entries: int, seed: int = 0, words_per_entry: int = 24) -> List[Tuple[str, str]]:
+    """Generate (content, category) pairs with a Zipf-like word distribution
+
+    Each entry also carries a unique identifier token so exact-term lookups
+    have a single correct answer.
+    """
+    rng = np.random.default_rng(seed)
+    ranks = np.arange(1, _VOCABULARY_SIZE + 1)
+    weights = 1.0 / ranks
+    weights /= weights.sum()
+
+    corpus = []
+    for i in range(n_entries):
+        words = rng.choice(_VOCABULARY_SIZE, size=words_per_entry, p=weights)
+        content = " ".join(f"w{w}" for w in words) + f" ERR-{i:06d}"
+        corpus.append((content, f"category_{i % 16}"))
+    return corpus
+
+
+def make_queries(corpus: List[Tuple[str, str]], n_queries: int, seed: int = 1) -> List[str]:
+    """Sample query strings that overlap with corpus content"""
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(corpus), size=n_queries)
+    queries = []
+    for i in picks:
+        words = corpus[i][0].split()
+        queries.append(" ".join(words[:4]))
+    return queries
+
+
+def make_agent_status(n_agents: int, capabilities: List[str], seed: int = 2) -> Dict[str, Dict[str, Any]]:
+    """Generate TeamCoordinator.agent_status for n_agents agents"""
+    rng = np.random.default_rng(seed)
+    status = {}
+    for i in range(n_agents):
+        k = int(rng.integers(1, len(capabilities) + 1))
+        status[f"agent_{i}"] = {
+            "available": bool(rng.random() > 0.1),
+            "capabilities": list(rng.choice(capabilities, size=k, replace=False)),
+        }
+    return status
+
+
+def make_tasks(n_tasks: int, capabilities: List[str], seed: int = 3) -> List[Dict[str, Any]]:
+    """Generate tasks with one or two required capabilities"""
+    rng = np.random.default_rng(seed)
+    tasks = []
+    for i in range(n_tasks):
+        k = int(rng.integers(1, 3))
+        tasks.append({
+            "id": f"task_{i}",
+            "required_capabilities": list(rng.choice(capabilities, size=k, replace=False)),
+            "priority": int(rng.integers(0, 4)),
+        })
+    return tasks
+
+
+def make_id_queries(n_entries: int, n_queries: int, seed: int = 4) -> List[Tuple[str, int]]:
+    """Exact-identifier queries paired with the index of the entry they name"""
+    rng = np.random.default_rng(seed)
+    return [(f"ERR-{i:06d}", int(i)) for i in rng.integers(0, n_entries, size=n_queries)]
@@ -31,6 +31,7 @@ setup(
         "asyncio>=3.4.3",
         "aiofiles>=0.8.0",
         "pyyaml>=6.0",
+        "numpy>=1.21.0",
     ],
     extras_require={
         "dev": [
@@ -40,6 +41,9 @@ setup(
             "black>=22.3.0",
             "flake8>=4.0.1",
             "mypy>=0.950",
+        ],
+        "sharding": [
+            "msgpack>=1.0.0",
         ]
     }
 )
\ No newline at end of file
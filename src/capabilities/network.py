@@ -6,6 +6,7 @@ import asyncio
 from ..core.capabilities import Capability, CapabilityMetadata
 from ..utils.error_handling import CapabilityError
 from ..utils.monitoring import monitor
+from ..utils.tracing import tracer
 
 class NetworkCapability(Capability):
     """Handles network operations"""
@@ -47,8 +48,10 @@ class NetworkCapability(Capability):
         if not url:
             raise CapabilityError("URL required for HTTP GET", "PARAMETER_ERROR")
 
+        tracer.annotate(method="GET", url=url)
         try:
             async with self._session.get(url, headers=headers) as response:
+                tracer.annotate(http_status=response.status)
                 return {
                     "status": response.status,
                     "headers": dict(response.headers),
@@ -67,8 +70,10 @@ class NetworkCapability(Capability):
         if not url or data is None:
             raise CapabilityError("URL and data required for HTTP POST", "PARAMETER_ERROR")
 
+        tracer.annotate(method="POST", url=url)
         try:
             async with self._session.post(url, json=data, headers=headers) as response:
+                tracer.annotate(http_status=response.status)
                 return {
                     "status": response.status,
                     "headers": dict(response.headers),
@@ -86,6 +91,7 @@ class NetworkCapability(Capability):
         if not url:
             raise CapabilityError("URL required for WebSocket", "PARAMETER_ERROR")
 
+        tracer.annotate(method="WEBSOCKET", url=url)
         try:
             async with self._session.ws_connect(url, protocols=[protocol] if protocol else None) as ws:
                 return {
@@ -93,4 +99,4 @@ class NetworkCapability(Capability):
                     "socket_id": id(ws)
                 }
         except Exception as e:
-            raise CapabilityError(f"WebSocket connection failed: {str(e)}", "NETWORK_ERROR")"
+            raise CapabilityError(f"WebSocket connection failed: {str(e)}", "NETWORK_ERROR")
@@ -0,0 +1,164 @@
+"""Admission Control for Agentic OS
+Throttles, defers or sheds new team tasks based on host load and queue depth."""
+from typing import Dict, Optional
+from dataclasses import dataclass
+import logging
+
+from ..utils.error_handling import TeamError
+from ..utils.system_monitor import SystemMonitor
+
+ADMIT = "admit"
+DEFER = "defer"
+SHED = "shed"
+
+
+@dataclass
+class AdmissionConfig:
+    """Watermarks and priority policy for task admission"""
+    memory_low_watermark: float = 80.0
+    memory_high_watermark: float = 90.0
+    memory_hard_limit: float = 97.0
+    cpu_low_watermark: float = 85.0
+    cpu_high_watermark: float = 95.0
+    cpu_window_seconds: float = 10.0
+    max_metrics_age: float = 5.0  # Older host samples are ignored
+    use_host_metrics: bool = True  # Teams create a SystemMonitor when given none
+    queue_low_watermark: int = 50
+    queue_high_watermark: int = 100
+    max_queue_depth: int = 200
+    critical_priority: int = 3  # Admitted whenever below the hard limits
+    shed_below_priority: int = 1  # Shed (not deferred) under overload
+    base_retry_after: float = 1.0
+    max_retry_after: float = 60.0
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of an admission check"""
+    action: str
+    reason: str
+    pressure: float
+    retry_after: Optional[float] = None
+
+    @property
+    def admitted(self) -> bool:
+        return self.action == ADMIT
+
+
+class AdmissionRejected(TeamError):
+    """Raised when a task is deferred or shed; carries a retry-after hint"""
+
+    def __init__(self, decision: AdmissionDecision):
+        super().__init__(
+            f"Task {decision.action}: {decision.reason} "
+            f"(retry after {decision.retry_after:.1f}s)"
+        )
+        self.decision = decision
+        self.retry_after = decision.retry_after
+
+
+class AdmissionController:
+    """Decides whether a new task may enter the team queue
+
+    Each signal (memory, CPU, queue depth) is mapped onto a pressure value:
+    0 at its low watermark and 1 at its high watermark. The controller
+    enters overload when any pressure reaches 1 and only leaves once all
+    of them fall back to 0, so it does not flap around a single threshold.
+    """
+
+    def __init__(self, config: AdmissionConfig, monitor: Optional[SystemMonitor] = None):
+        self.config = config
+        self.monitor = monitor
+        self.logger = logging.getLogger("admission")
+        self.overloaded = False
+        self._metrics_stale = False
+        self.stats: Dict[str, int] = {ADMIT: 0, DEFER: 0, SHED: 0}
+
+    def evaluate(self, priority: int, queue_depth: int) -> AdmissionDecision:
+        """Decide how to handle a task of the given priority"""
+        signals = self._read_signals(queue_depth)
+        pressures = self._pressures(signals)
+        pressure = max(pressures.values())
+        hottest = max(pressures, key=pressures.get)
+
+        if pressure >= 1.0:
+            self.overloaded = True
+        elif pressure <= 0.0:
+            self.overloaded = False
+
+        decision = self._decide(priority, signals, pressure, hottest)
+        self.stats[decision.action] += 1
+        if not decision.admitted:
+            self.logger.warning(
+                f"Task {decision.action} (priority {priority}): {decision.reason}"
+            )
+        return decision
+
+    def _decide(
+        self, priority: int, signals: Dict[str, float], pressure: float, hottest: str
+    ) -> AdmissionDecision:
+        config = self.config
+
+        if signals["queue"] >= config.max_queue_depth:
+            return self.reject(SHED, "task queue is full", pressure)
+        if signals["memory"] >= config.memory_hard_limit:
+            return self.reject(SHED, f"memory at {signals['memory']:.1f}%", pressure)
+
+        if self.overloaded:
+            if priority >= config.critical_priority:
+                return AdmissionDecision(ADMIT, "critical priority", pressure)
+            action = SHED if priority < config.shed_below_priority else DEFER
+            return self.reject(action, f"overloaded ({hottest})", pressure)
+
+        # Between the watermarks, hold back only the lowest priorities
+        if pressure > 0.0 and priority < config.shed_below_priority:
+            return self.reject(DEFER, f"throttling ({hottest})", pressure)
+
+        return AdmissionDecision(ADMIT, "within capacity", pressure)
+
+    def reject(self, action: str, reason: str, pressure: float) -> AdmissionDecision:
+        """Build a rejection with a retry-after scaled by current pressure"""
+        retry_after = self.config.base_retry_after * (1.0 + max(0.0, pressure))
+        if action == SHED:
+            retry_after *= 4
+        retry_after = min(retry_after, self.config.max_retry_after)
+        return AdmissionDecision(action, reason, pressure, retry_after)
+
+    def _read_signals(self, queue_depth: int) -> Dict[str, float]:
+        """Collect current load signals; host metrics are optional"""
+        signals = {"queue": float(queue_depth), "memory": 0.0, "cpu": 0.0}
+        if self.monitor is None:
+            return signals
+
+        try:
+            latest = self.monitor.get_recent_metrics(self.config.max_metrics_age)
+            if latest is None:
+                # A stopped or stalled sampler; frozen readings are worse than none
+                if not self._metrics_stale:
+                    self.logger.warning("System metrics are stale; admitting on queue depth only")
+                self._metrics_stale = True
+                return signals
+
+            self._metrics_stale = False
+            signals["memory"] = latest.memory_percent
+            cpu = self.monitor.get_window_mean("cpu_percent", self.config.cpu_window_seconds)
+            signals["cpu"] = cpu if cpu is not None else latest.cpu_percent
+        except Exception as e:
+            # Fail open on host metrics; queue depth still bounds intake
+            self.logger.error(f"Failed to read system metrics: {str(e)}")
+        return signals
+
+    def _pressures(self, signals: Dict[str, float]) -> Dict[str, float]:
+        """Map each signal onto 0 (low watermark) .. 1 (high watermark)"""
+        config = self.config
+        return {
+            "memory": self._scale(signals["memory"], config.memory_low_watermark, config.memory_high_watermark),
+            "cpu": self._scale(signals["cpu"], config.cpu_low_watermark, config.cpu_high_watermark),
+            "queue": self._scale(signals["queue"], config.queue_low_watermark, config.queue_high_watermark),
+        }
+
+    @staticmethod
+    def _scale(value: float, low: float, high: float) -> float:
+        if high <= low:
+            return 1.0 if value >= high else 0.0
+        return max(0.0, (value - low) / (high - low))
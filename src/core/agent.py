@@ -11,6 +11,7 @@ from .capabilities import Capability
 from .processing import Pipeline
 from ..utils.error_handling import AgentError, handle_error
 from ..utils.monitoring import monitor
+from ..utils.tracing import tracer
 
 @dataclass
 class AgentConfig:
@@ -40,7 +41,8 @@ class Agent:
             self._validate_input(input_data)
             context = self._create_context(input_data)
             async with asyncio.timeout(self.timeout):
-                result = await self.pipeline.process(context)
+                with tracer.span("agent.pipeline"):
+                    result = await self.pipeline.process(context)
             self.memory.add(context, result)
             return self._format_result(result)
         except asyncio.TimeoutError:
@@ -58,6 +60,10 @@ class Agent:
         except Exception as e:
             raise AgentError(f"Failed to add capability: {str(e)}", "CAPABILITY_ERROR")
 
+    def _trace_context(self) -> Dict[str, Any]:
+        """Context attached to spans opened by this agent"""
+        return {"agent": self.name}
+
     def _initialize(self) -> None:
         self.logger.info(f"Initializing agent: {self.name}")
         self._setup_monitoring()
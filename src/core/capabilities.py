@@ -36,6 +36,10 @@ class Capability(ABC):
     def version(self) -> str:
         return self.metadata.version
 
+    def _trace_context(self) -> Dict[str, Any]:
+        """Context attached to spans opened by this capability"""
+        return {"capability": self.name}
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize capability resources"""
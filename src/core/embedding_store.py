@@ -0,0 +1,175 @@
+"""Embedding Store for Agentic OS
+Row-oriented NumPy storage for entry embeddings with tombstones and compaction."""
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+
+class EmbeddingStore:
+    """Dense matrix of embeddings addressed by entry ID
+
+    Deleting an entry only clears its row's live flag (a tombstone), so
+    deletes are O(1); searches mask tombstoned rows out. compact_step()
+    slides live rows down over dead ones a chunk at a time, leaving the
+    store valid between steps so searches can interleave with compaction.
+    """
+
+    def __init__(self, dimension: int, initial_capacity: int = 1024, dtype: type = np.float32):
+        self.dimension = dimension
+        self._vectors = np.zeros((initial_capacity, dimension), dtype=dtype)
+        self._norms = np.zeros(initial_capacity, dtype=dtype)
+        self._alive = np.zeros(initial_capacity, dtype=bool)
+        self._ids: List[Optional[str]] = [None] * initial_capacity
+        self._rows: Dict[str, int] = {}  # Entry ID -> row
+        self._size = 0  # Rows in use, live or dead
+        self._compact_read: Optional[int] = None
+        self._compact_write = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._rows
+
+    @property
+    def live_count(self) -> int:
+        return len(self._rows)
+
+    @property
+    def dead_count(self) -> int:
+        return self._size - len(self._rows)
+
+    @property
+    def dead_fraction(self) -> float:
+        return self.dead_count / self._size if self._size else 0.0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        return self._vectors.nbytes + self._norms.nbytes + self._alive.nbytes
+
+    @property
+    def compacting(self) -> bool:
+        return self._compact_read is not None
+
+    def add(self, entry_id: str, vector: np.ndarray) -> None:
+        """Append an embedding, growing the matrix when full"""
+        if entry_id in self._rows:
+            self.update(entry_id, vector)
+            return
+        if self._size == self.capacity:
+            self._resize(max(1, self.capacity * 2))
+
+        row = self._size
+        self._write_row(row, entry_id, vector)
+        self._rows[entry_id] = row
+        self._size += 1
+
+    def update(self, entry_id: str, vector: np.ndarray) -> None:
+        """Replace an embedding in place"""
+        row = self._rows[entry_id]
+        self._vectors[row] = vector
+        self._norms[row] = np.linalg.norm(self._vectors[row])
+
+    def get(self, entry_id: str) -> Optional[np.ndarray]:
+        """Copy of an entry's embedding; rows move during compaction, so no views"""
+        row = self._rows.get(entry_id)
+        return None if row is None else self._vectors[row].copy()
+
+    def delete(self, entry_id: str) -> bool:
+        """Tombstone an entry's row; returns False if it was not stored"""
+        row = self._rows.pop(entry_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._ids[row] = None
+        return True
+
+    def search(self, query: np.ndarray, top_k: int) -> List[Tuple[str, float]]:
+        """Top live entries by cosine similarity"""
+        if not self._rows or top_k <= 0:
+            return []
+
+        similarities = self._similarities(query, slice(0, self._size))
+        similarities[~self._alive[:self._size]] = -np.inf
+
+        k = min(top_k, len(self._rows))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [(self._ids[row], float(similarities[row])) for row in top]
+
+    def similarities(self, query: np.ndarray, entry_ids: Iterable[str]) -> Dict[str, float]:
+        """Cosine similarity for the given live entries (others are skipped)"""
+        ids = [entry_id for entry_id in entry_ids if entry_id in self._rows]
+        if not ids:
+            return {}
+        rows = np.fromiter((self._rows[entry_id] for entry_id in ids), dtype=np.intp, count=len(ids))
+        return dict(zip(ids, self._similarities(query, rows).tolist()))
+
+    def compact_step(self, chunk: int = 4096) -> bool:
+        """Move up to `chunk` rows of the current compaction pass
+
+        Rows below the write cursor are compacted, rows between the cursors
+        are free (marked dead), and rows at or past the read cursor are
+        untouched; rows appended meanwhile simply join the unread tail.
+        Returns True once the pass has finished.
+        """
+        if self._compact_read is None:
+            self._compact_read = 0
+            self._compact_write = 0
+
+        read, write = self._compact_read, self._compact_write
+        stop = min(self._size, read + chunk)
+        for row in range(read, stop):
+            if not self._alive[row]:
+                continue
+            if row != write:
+                entry_id = self._ids[row]
+                self._vectors[write] = self._vectors[row]
+                self._norms[write] = self._norms[row]
+                self._alive[write] = True
+                self._ids[write] = entry_id
+                self._rows[entry_id] = write
+                self._alive[row] = False
+                self._ids[row] = None
+            write += 1
+
+        self._compact_read, self._compact_write = stop, write
+        if stop < self._size:
+            return False
+
+        # Pass complete: everything past the write cursor is free
+        self._size = write
+        self._compact_read = None
+        if self.capacity > 1024 and self._size < self.capacity // 4:
+            self._resize(max(1024, self.capacity // 2))
+        return True
+
+    def _similarities(self, query: np.ndarray, rows) -> np.ndarray:
+        query = np.asarray(query, dtype=self._vectors.dtype)
+        query_norm = np.linalg.norm(query)
+        dots = self._vectors[rows] @ query
+        norms = self._norms[rows] * query_norm
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(norms > 0, dots / norms, 0.0)
+
+    def _write_row(self, row: int, entry_id: str, vector: np.ndarray) -> None:
+        self._vectors[row] = vector
+        self._norms[row] = np.linalg.norm(self._vectors[row])
+        self._alive[row] = True
+        self._ids[row] = entry_id
+
+    def _resize(self, capacity: int) -> None:
+        """Reallocate backing arrays, keeping the rows in use"""
+        size = self._size
+        vectors = np.zeros((capacity, self.dimension), dtype=self._vectors.dtype)
+        norms = np.zeros(capacity, dtype=self._norms.dtype)
+        alive = np.zeros(capacity, dtype=bool)
+        vectors[:size] = self._vectors[:size]
+        norms[:size] = self._norms[:size]
+        alive[:size] = self._alive[:size]
+
+        self._vectors, self._norms, self._alive = vectors, norms, alive
+        self._ids = self._ids[:size] + [None] * (capacity - size)
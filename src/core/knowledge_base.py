@@ -1,11 +1,17 @@
 """Knowledge Base System for Agentic OS
 Provides structured knowledge storage and retrieval with vector embeddings."""
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import asyncio
+import heapq
 import numpy as np
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, InitVar
 import json
+import time
+import uuid
 
+from .embedding_store import EmbeddingStore
+from .lexical_index import InvertedIndex
 from ..utils.error_handling import KnowledgeBaseError
 from ..utils.monitoring import monitor
 
@@ -13,17 +19,63 @@ from ..utils.monitoring import monitor
 class KnowledgeEntry:
     id: str
     content: str
-    embedding: np.ndarray
+    embedding: InitVar[Optional[np.ndarray]]
     metadata: Dict[str, Any]
     timestamp: datetime
     category: str
     source: str
 
+    def __post_init__(self, embedding: Optional[np.ndarray]):
+        self._embedding = embedding  # Held until the entry is indexed
+        self._store: Optional[EmbeddingStore] = None
+
+    def _attach(self, store: EmbeddingStore) -> None:
+        """Hand the embedding over to the store; the entry keeps no copy"""
+        store.add(self.id, self._embedding)
+        self._store = store
+        self._embedding = None
+
+
+def _entry_embedding(entry: KnowledgeEntry) -> Optional[np.ndarray]:
+    """Embedding as stored by the knowledge base (a copy), or as constructed"""
+    if entry._store is not None:
+        return entry._store.get(entry.id)
+    return entry._embedding
+
+# Set after @dataclass so the InitVar keeps `embedding` in the constructor
+KnowledgeEntry.embedding = property(_entry_embedding)
+
 class KnowledgeBase:
-    def __init__(self, embedding_dimension: int = 768):
+    """Knowledge entries with category, lexical (BM25) and vector indexes
+
+    Deletes and re-categorisations only tombstone `index`, so it may list
+    stale IDs until compaction; read categories via get_category_entries().
+    """
+
+    def __init__(
+        self,
+        embedding_dimension: int = 768,
+        compaction_threshold: float = 0.25,
+        compaction_min_dead: int = 256,
+        compaction_chunk: int = 4096
+    ):
         self.embedding_dimension = embedding_dimension
         self.entries: Dict[str, KnowledgeEntry] = {}
-        self.index: Dict[str, List[str]] = {}  # Category -> Entry IDs
+        self.index: Dict[str, List[str]] = {}  # Category -> Entry IDs, may hold stale IDs
+        self.lexical_index = InvertedIndex()  # Term -> Entry IDs, BM25 scored
+        self.embedding_store = EmbeddingStore(embedding_dimension)
+        self.compaction_threshold = compaction_threshold
+        self.compaction_min_dead = compaction_min_dead
+        self.compaction_chunk = compaction_chunk
+        self._index_tombstones: Dict[str, int] = {}  # Category -> stale IDs in index
+        self._compaction_task: Optional[asyncio.Task] = None
+        self._compacting = False
+        self._compaction_stats = {
+            "compactions": 0,
+            "rows_reclaimed": 0,
+            "last_compaction_ms": 0.0,
+            "total_compaction_ms": 0.0
+        }
         self._initialize_embeddings()
 
     def _initialize_embeddings(self):
@@ -59,33 +111,217 @@ class KnowledgeBase:
         except Exception as e:
             raise KnowledgeBaseError(f"Failed to add entry: {str(e)}")
 
-    async def query(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
-        """Query knowledge base using semantic search"""
+    @monitor
+    async def query(
+        self,
+        query: str,
+        top_k: int = 5,
+        mode: str = "vector",
+        candidates: int = 100,
+        rrf_k: int = 60
+    ) -> List[Dict[str, Any]]:
+        """Query knowledge base
+
+        Modes:
+            vector  - semantic search over all entries
+            lexical - BM25 over the inverted index; no embedding is generated
+            hybrid  - BM25 picks up to `candidates` entries, which are re-ranked
+                      by reciprocal rank fusion of BM25 and vector similarity
+        """
         try:
-            query_embedding = await self._generate_embedding(query)
-            scores = {}
-            
-            for entry_id, entry in self.entries.items():
-                similarity = self._compute_similarity(query_embedding, entry.embedding)
-                scores[entry_id] = similarity
-            
-            # Get top-k results
-            top_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
-            
+            similarities: Dict[str, float] = {}
+
+            if mode == "lexical":
+                ranked = self.lexical_index.search(query, top_k)
+            elif mode == "vector":
+                query_embedding = await self._generate_embedding(query)
+                ranked = self.embedding_store.search(query_embedding, top_k)
+                similarities = dict(ranked)
+            elif mode == "hybrid":
+                # Embed first: nothing below awaits, so no entry can vanish mid-query
+                query_embedding = await self._generate_embedding(query)
+                lexical = self.lexical_index.search(query, candidates)
+                if lexical:
+                    similarities = self.embedding_store.similarities(
+                        query_embedding, [entry_id for entry_id, _ in lexical]
+                    )
+                    vector_ranked = self._top(similarities, len(similarities))
+                else:
+                    vector_ranked = self.embedding_store.search(query_embedding, candidates)
+                    similarities = dict(vector_ranked)
+                ranked = self._reciprocal_rank_fusion([lexical, vector_ranked], rrf_k)[:top_k]
+            else:
+                raise KnowledgeBaseError(f"Unknown query mode: {mode}")
+
             return [
                 {
                     "id": entry_id,
                     "content": self.entries[entry_id].content,
-                    "similarity": score,
+                    "similarity": similarities.get(entry_id),
+                    "score": score,
                     "metadata": self.entries[entry_id].metadata,
                     "category": self.entries[entry_id].category
                 }
-                for entry_id, score in top_results
+                for entry_id, score in ranked
             ]
             
         except Exception as e:
             raise KnowledgeBaseError(f"Query failed: {str(e)}")
 
+    @monitor
+    async def update_entry(
+        self,
+        entry_id: str,
+        content: Optional[str] = None,
+        category: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        source: Optional[str] = None
+    ) -> KnowledgeEntry:
+        """Update an entry in place; content changes are re-embedded and re-indexed"""
+        entry = self.entries.get(entry_id)
+        if entry is None:
+            raise KnowledgeBaseError(f"Entry not found: {entry_id}")
+
+        try:
+            if content is not None and content != entry.content:
+                embedding = await self._generate_embedding(content)
+                if self.entries.get(entry_id) is not entry:
+                    raise KnowledgeBaseError(f"Entry was deleted during update: {entry_id}")
+                # Store first: it raises on a missing row before any index is touched
+                self.embedding_store.update(entry_id, embedding)
+                self.lexical_index.remove(entry_id, entry.content)
+                self.lexical_index.add(entry_id, content)
+                entry.content = content
+
+            if category is not None and category != entry.category:
+                self._tombstone_in_index(entry.category)
+                self.index.setdefault(category, []).append(entry_id)
+                entry.category = category
+
+            if metadata is not None:
+                entry.metadata = metadata
+            if source is not None:
+                entry.source = source
+            entry.timestamp = datetime.utcnow()
+
+            return entry
+
+        except Exception as e:
+            raise KnowledgeBaseError(f"Failed to update entry: {str(e)}")
+
+    @monitor
+    async def delete_entry(self, entry_id: str) -> bool:
+        """Delete an entry; returns False if it does not exist
+
+        Rows are tombstoned rather than removed, so this is O(1) in the
+        size of the knowledge base; compaction reclaims the space later.
+        """
+        entry = self.entries.pop(entry_id, None)
+        if entry is None:
+            return False
+
+        self.embedding_store.delete(entry_id)
+        self.lexical_index.remove(entry_id, entry.content)
+        self._tombstone_in_index(entry.category)
+        self._maybe_schedule_compaction()
+        return True
+
+    def get_embedding(self, entry_id: str) -> Optional[np.ndarray]:
+        """Copy of an entry's stored embedding, or None if it does not exist"""
+        return self.embedding_store.get(entry_id)
+
+    def get_category_entries(self, category: str) -> List[str]:
+        """Live entry IDs in a category, skipping tombstoned index slots"""
+        if not self._index_tombstones.get(category):
+            return list(self.index.get(category, []))
+        return self._live_category_ids(category)
+
+    async def compact(self) -> None:
+        """Reclaim tombstoned rows incrementally, yielding to queries between chunks"""
+        if self._compacting:
+            return
+
+        self._compacting = True
+        started = time.perf_counter()
+        reclaimed = self.embedding_store.dead_count
+        try:
+            while not self.embedding_store.compact_step(self.compaction_chunk):
+                await asyncio.sleep(0)
+
+            for category in list(self._index_tombstones):
+                self.index[category] = self._live_category_ids(category)
+                del self._index_tombstones[category]
+                await asyncio.sleep(0)
+        finally:
+            self._compacting = False
+
+        elapsed_ms = (time.perf_counter() - started) * 1e3
+        stats = self._compaction_stats
+        stats["compactions"] += 1
+        stats["rows_reclaimed"] += max(0, reclaimed - self.embedding_store.dead_count)
+        stats["last_compaction_ms"] = elapsed_ms
+        stats["total_compaction_ms"] += elapsed_ms
+
+    def get_storage_metrics(self) -> Dict[str, Any]:
+        """Live/dead row counts and compaction statistics"""
+        store = self.embedding_store
+        return {
+            "live_entries": store.live_count,
+            "dead_rows": store.dead_count,
+            "dead_fraction": store.dead_fraction,
+            "capacity_rows": store.capacity,
+            "embedding_bytes": store.nbytes,
+            "index_tombstones": sum(self._index_tombstones.values()),
+            "compacting": self._compacting,
+            **self._compaction_stats
+        }
+
+    def _tombstone_in_index(self, category: str):
+        """Leave a stale ID in the category list; compaction drops it"""
+        self._index_tombstones[category] = self._index_tombstones.get(category, 0) + 1
+
+    def _live_category_ids(self, category: str) -> List[str]:
+        live = (
+            entry_id for entry_id in self.index.get(category, [])
+            if entry_id in self.entries and self.entries[entry_id].category == category
+        )
+        return list(dict.fromkeys(live))
+
+    def _maybe_schedule_compaction(self):
+        """Start background compaction once the dead fraction crosses the threshold"""
+        store = self.embedding_store
+        if (
+            store.dead_count < self.compaction_min_dead
+            or store.dead_fraction < self.compaction_threshold
+            or self._compacting
+            or (self._compaction_task is not None and not self._compaction_task.done())
+        ):
+            return
+        self._compaction_task = asyncio.get_running_loop().create_task(self.compact())
+
+    @staticmethod
+    def _top(scores: Dict[str, float], k: int) -> List[Tuple[str, float]]:
+        return heapq.nlargest(k, scores.items(), key=lambda x: x[1])
+
+    @staticmethod
+    def _reciprocal_rank_fusion(rankings: List[List[Tuple[str, float]]], k: int) -> List[Tuple[str, float]]:
+        """Fuse rankings by summing 1 / (k + rank) per entry"""
+        fused: Dict[str, float] = {}
+        for ranking in rankings:
+            for rank, (entry_id, _) in enumerate(ranking, start=1):
+                fused[entry_id] = fused.get(entry_id, 0.0) + 1.0 / (k + rank)
+        return sorted(fused.items(), key=lambda x: x[1], reverse=True)
+
+    def _generate_id(self) -> str:
+        """Generate unique entry ID"""
+        return f"kb_{uuid.uuid4().hex}"
+
+    def _index_entry(self, entry: KnowledgeEntry):
+        """Add entry to the category, lexical and embedding indexes"""
+        self.index.setdefault(entry.category, []).append(entry.id)
+        self.lexical_index.add(entry.id, entry.content)
+        entry._attach(self.embedding_store)
+
     async def _generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for text"""
         # Implement embedding generation (e.g., using sentence-transformers)
@@ -0,0 +1,100 @@
+"""Lexical Index for Agentic OS
+Incremental inverted index with BM25 scoring for exact-term retrieval."""
+from typing import Dict, List, Tuple
+from collections import Counter
+import heapq
+import math
+import re
+
+# Words, optionally joined by - . : / so IDs like ERR-0042 stay whole
+_TOKEN_PATTERN = re.compile(r"\w+(?:[-.:/]\w+)*")
+_SPLIT_PATTERN = re.compile(r"[-.:/]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case terms; compound identifiers also yield their parts"""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(token)
+        if not token.isalnum():
+            tokens.extend(part for part in _SPLIT_PATTERN.split(token) if part)
+    return tokens
+
+
+class InvertedIndex:
+    """Term -> {doc_id: term frequency} postings, updated one document at a time"""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document"""
+        terms = Counter(tokenize(text))
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        length = sum(terms.values())
+        self.doc_lengths[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id: str, text: str) -> None:
+        """Drop a document, given the text it was indexed with"""
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+
+        for term in set(tokenize(text)):
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[term]
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Top documents by BM25 score; documents matching no term are omitted"""
+        n_docs = len(self.doc_lengths)
+        if not n_docs:
+            return []
+
+        average_length = self._total_length / n_docs
+        k1, b = self.k1, self.b
+        scores: Dict[str, float] = {}
+
+        for term in self._query_terms(query):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                norm = k1 * (1.0 - b + b * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1.0) / (tf + norm)
+
+        return heapq.nlargest(top_k, scores.items(), key=lambda x: x[1])
+
+    def _query_terms(self, query: str) -> set:
+        """Distinct query terms
+
+        A compound identifier is only split into its parts when it is not
+        indexed whole, so ERR-0042 does not also scan every 'err' posting.
+        """
+        terms = set()
+        for token in _TOKEN_PATTERN.findall(query.lower()):
+            if token.isalnum() or token in self.postings:
+                terms.add(token)
+            else:
+                terms.update(part for part in _SPLIT_PATTERN.split(token) if part)
+        return terms
@@ -0,0 +1,508 @@
+"""Sharded Agent Teams for Agentic OS
+Places member agents on worker processes, each running its own event loop."""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+
+from .agent import Agent, AgentConfig
+from .team import AgentTeam, TeamConfig
+from ..utils.error_handling import TeamError
+from ..utils.monitoring import monitor
+from ..utils.system_monitor import SystemMonitor
+
+try:
+    import msgpack
+except ImportError:  # Optional: frames fall back to pickle
+    msgpack = None
+
+# Frame kinds
+SPAWN = 0
+RUN = 1
+RESULT = 2
+ERROR = 3
+STOP = 4
+RETIRE = 5
+PING = 6
+PONG = 7
+
+
+class FrameCodec:
+    """Encodes protocol frames as (kind, request_id, body) tuples
+
+    msgpack is used when installed, otherwise frames are pickled. msgpack
+    rejects values it cannot represent (datetimes, arrays, custom objects)
+    instead of converting them, so a result never silently changes type
+    with the codec; such requests fail with an ERROR frame. Note that
+    msgpack still delivers tuples as lists.
+    """
+
+    def __init__(self, name: str = "auto"):
+        if name == "auto":
+            name = "msgpack" if msgpack is not None else "pickle"
+        if name == "msgpack" and msgpack is None:
+            raise TeamError("msgpack codec requested but msgpack is not installed")
+        if name not in ("msgpack", "pickle"):
+            raise TeamError(f"Unknown frame codec: {name}")
+        self.name = name
+
+    def dumps(self, frame: Tuple[int, int, Any]) -> bytes:
+        if self.name == "msgpack":
+            return msgpack.packb(frame, use_bin_type=True)
+        return pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Tuple[int, int, Any]:
+        if self.name == "msgpack":
+            return tuple(msgpack.unpackb(data, raw=False, strict_map_key=False))
+        return pickle.loads(data)
+
+
+@dataclass
+class ShardConfig:
+    """Worker pool settings for a sharded team"""
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    start_method: Optional[str] = None  # multiprocessing default when None
+    codec: str = "auto"
+    # Builds agents inside worker processes; must be picklable under "spawn"
+    agent_factory: Callable[[AgentConfig], Any] = Agent
+    # Transport failures (undecodable frames, failed sends) before a shard is
+    # taken out of rotation; agent exceptions never count towards this
+    max_consecutive_failures: int = 3
+    # Seconds between health probes; a shard that leaves a probe unanswered
+    # this long (e.g. a blocked event loop) is taken out of rotation
+    probe_interval: float = 5.0
+    # Deadline for one subtask; None means the agent's own timeout + request_margin
+    request_timeout: Optional[float] = None
+    request_margin: float = 5.0
+    stop_timeout: float = 5.0
+
+
+@dataclass
+class ShardStats:
+    """Health and load of a single worker process"""
+    shard_id: int
+    alive: bool = True
+    agents: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    consecutive_failures: int = 0
+    latency_ewma: float = 0.0
+    last_seen: float = field(default_factory=time.monotonic)
+    last_probe: float = 0.0
+    probe_sent: Optional[float] = None  # Outstanding (unanswered) probe
+
+    @property
+    def load(self) -> float:
+        """Expected queueing cost of sending one more request here"""
+        return (self.in_flight + 1) * max(self.latency_ewma, 1e-6)
+
+
+def _shard_main(shard_id: int, conn: Any, codec_name: str, agent_factory: Callable) -> None:
+    """Worker process entry point"""
+    asyncio.run(_serve(shard_id, conn, FrameCodec(codec_name), agent_factory))
+
+
+async def _serve(shard_id: int, conn: Any, codec: FrameCodec, agent_factory: Callable) -> None:
+    """Run agents hosted on this shard until told to stop"""
+    logger = logging.getLogger(f"shard.{shard_id}")
+    loop = asyncio.get_running_loop()
+    agents: Dict[str, Any] = {}
+    running = set()
+
+    async def run(request_id: int, agent_id: str, subtask: Dict[str, Any]):
+        try:
+            result = await agents[agent_id].process(subtask)
+            data = codec.dumps((RESULT, request_id, result))
+        except Exception as e:
+            data = codec.dumps((ERROR, request_id, f"{type(e).__name__}: {str(e)}"))
+        conn.send_bytes(data)
+
+    while True:
+        try:
+            # Blocking pipe read happens off the shard's event loop
+            data = await loop.run_in_executor(None, conn.recv_bytes)
+        except (EOFError, OSError):
+            break  # Parent went away
+
+        kind, request_id, body = codec.loads(data)
+        if kind == RUN:
+            task = loop.create_task(run(request_id, body[0], body[1]))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        elif kind == SPAWN:
+            agent_id, agent_config = body
+            try:
+                agents[agent_id] = agent_factory(AgentConfig(**agent_config))
+            except Exception as e:
+                logger.error(f"Failed to create agent {agent_id}: {str(e)}")
+        elif kind == RETIRE:
+            agents.pop(body, None)
+        elif kind == PING:
+            conn.send_bytes(codec.dumps((PONG, request_id, None)))
+        elif kind == STOP:
+            break
+
+    if running:
+        await asyncio.gather(*running, return_exceptions=True)
+    conn.close()
+
+
+class ShardPool:
+    """Worker processes plus the parent-side request/response bookkeeping"""
+
+    def __init__(self, config: ShardConfig):
+        self.config = config
+        self.codec = FrameCodec(config.codec)
+        self.logger = logging.getLogger("shard_pool")
+        self.stats: Dict[int, ShardStats] = {}
+        self._processes: Dict[int, Any] = {}
+        self._conns: Dict[int, Any] = {}
+        self._send_locks: Dict[int, threading.Lock] = {}
+        self._readers: List[threading.Thread] = []
+        self._pending: Dict[int, Tuple[asyncio.Future, asyncio.AbstractEventLoop, int, float]] = {}
+        self._pending_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._stopping = False
+
+    def start(self) -> None:
+        """Start all worker processes, then their reader threads"""
+        context = multiprocessing.get_context(self.config.start_method)
+        for shard_id in range(self.config.workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_shard_main,
+                args=(shard_id, child_conn, self.codec.name, self.config.agent_factory),
+                name=f"agent-shard-{shard_id}",
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._processes[shard_id] = process
+            self._conns[shard_id] = parent_conn
+            self._send_locks[shard_id] = threading.Lock()
+            self.stats[shard_id] = ShardStats(shard_id)
+
+        # Readers start after every fork so no child inherits a reader thread
+        for shard_id in self._conns:
+            reader = threading.Thread(
+                target=self._read_loop, args=(shard_id,), name=f"shard-reader-{shard_id}", daemon=True
+            )
+            reader.start()
+            self._readers.append(reader)
+
+    def stop(self) -> None:
+        """Ask workers to finish in-flight work and exit"""
+        self._stopping = True
+        for shard_id in list(self._conns):
+            try:
+                self._send(shard_id, (STOP, 0, None))
+            except TeamError:
+                pass
+        for shard_id, process in self._processes.items():
+            process.join(self.config.stop_timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            self._conns[shard_id].close()
+        for reader in self._readers:
+            reader.join(self.config.stop_timeout)
+
+        self._processes.clear()
+        self._conns.clear()
+        self._readers.clear()
+
+    def spawn_agent(self, shard_id: int, agent_id: str, agent_config: AgentConfig) -> None:
+        """Create an agent inside a worker process"""
+        self._send(shard_id, (SPAWN, 0, [agent_id, asdict(agent_config)]))
+        self.stats[shard_id].agents += 1
+
+    def retire_agent(self, shard_id: int, agent_id: str) -> None:
+        """Drop an agent from a shard; in-flight requests on it still complete"""
+        self.stats[shard_id].agents = max(0, self.stats[shard_id].agents - 1)
+        if self.stats[shard_id].alive:
+            try:
+                self._send(shard_id, (RETIRE, 0, agent_id))
+            except TeamError:
+                pass  # Shard is gone, and the agent with it
+
+    async def submit(
+        self, shard_id: int, agent_id: str, subtask: Dict[str, Any], timeout: float
+    ) -> Dict[str, Any]:
+        """Run a subtask on an agent hosted by shard_id
+
+        A request with no reply within timeout seconds fails as a transport
+        failure, so a stuck worker cannot hang its callers.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request_id = next(self._request_ids)
+        try:
+            data = self.codec.dumps((RUN, request_id, [agent_id, subtask]))
+        except Exception as e:
+            raise TeamError(f"Cannot encode subtask for shard {shard_id}: {str(e)}")
+
+        with self._pending_lock:
+            self._pending[request_id] = (future, loop, shard_id, time.perf_counter())
+            self.stats[shard_id].in_flight += 1
+        try:
+            self._send_bytes(shard_id, data)
+        except TeamError:
+            self._complete(request_id, None, error="shard unavailable", transport=True)
+            raise
+
+        deadline = loop.call_later(
+            timeout, self._complete, request_id, None, f"no reply within {timeout:.1f}s", True
+        )
+        try:
+            return await future
+        finally:
+            deadline.cancel()
+
+    def healthy_shards(self) -> List[int]:
+        """Shards that are alive, not failing repeatedly and answering probes
+
+        A shard is probed when it is over the failure limit, or when it has
+        requests in flight but has sent nothing for probe_interval seconds.
+        """
+        now = time.monotonic()
+        interval = self.config.probe_interval
+        healthy = []
+        for shard_id, stats in self.stats.items():
+            if not stats.alive:
+                continue
+            failing = stats.consecutive_failures >= self.config.max_consecutive_failures
+            if failing or (stats.in_flight and now - stats.last_seen > interval):
+                self._probe(shard_id, now)
+            unresponsive = stats.probe_sent is not None and now - stats.probe_sent > interval
+            if not failing and not unresponsive:
+                healthy.append(shard_id)
+        return healthy
+
+    def is_healthy(self, shard_id: int) -> bool:
+        return shard_id in self.healthy_shards()
+
+    def least_loaded(self, exclude: Iterable[int] = ()) -> int:
+        """Pick the healthy shard with the lowest expected load"""
+        excluded = set(exclude)
+        candidates = [s for s in self.healthy_shards() if s not in excluded]
+        if not candidates:
+            raise TeamError("No healthy shards available")
+        return min(candidates, key=lambda s: (self.stats[s].load, self.stats[s].agents))
+
+    def _send(self, shard_id: int, frame: Tuple[int, int, Any]) -> None:
+        self._send_bytes(shard_id, self.codec.dumps(frame))
+
+    def _send_bytes(self, shard_id: int, data: bytes) -> None:
+        try:
+            with self._send_locks[shard_id]:
+                self._conns[shard_id].send_bytes(data)
+        except (KeyError, OSError, ValueError) as e:
+            self._mark_dead(shard_id)
+            raise TeamError(f"Shard {shard_id} unavailable: {str(e)}")
+
+    def _read_loop(self, shard_id: int) -> None:
+        """Reader thread: resolve futures as result frames arrive"""
+        conn = self._conns[shard_id]
+        while True:
+            try:
+                data = conn.recv_bytes()
+            except (EOFError, OSError):
+                break
+
+            stats = self.stats[shard_id]
+            try:
+                kind, request_id, body = self.codec.loads(data)
+            except Exception as e:
+                # The channel is unreliable; the lost request fails at its deadline
+                stats.consecutive_failures += 1
+                self.logger.error(f"Shard {shard_id} sent an undecodable frame: {str(e)}")
+                continue
+
+            stats.last_seen = time.monotonic()
+            stats.probe_sent = None  # Any frame shows the shard's loop is running
+            if kind == RESULT:
+                self._complete(request_id, body)
+            elif kind == ERROR:
+                self._complete(request_id, None, error=body)
+            elif kind == PONG:
+                stats.consecutive_failures = 0
+
+        self._mark_dead(shard_id)
+
+    def _probe(self, shard_id: int, now: float) -> None:
+        """Ping a shard at most once per probe_interval; a reply restores it"""
+        stats = self.stats[shard_id]
+        if stats.probe_sent is not None or now - stats.last_probe < self.config.probe_interval:
+            return
+        stats.last_probe = stats.probe_sent = now
+        try:
+            self._send(shard_id, (PING, 0, None))
+        except TeamError:
+            pass
+
+    def _complete(
+        self, request_id: int, result: Any, error: Optional[str] = None, transport: bool = False
+    ) -> None:
+        """Resolve a pending request; only transport failures count against shard health"""
+        with self._pending_lock:
+            entry = self._pending.pop(request_id, None)
+            if entry is None:
+                return
+            future, loop, shard_id, started = entry
+            stats = self.stats[shard_id]
+            stats.in_flight -= 1
+            elapsed = time.perf_counter() - started
+            stats.latency_ewma = elapsed if not stats.latency_ewma else 0.8 * stats.latency_ewma + 0.2 * elapsed
+            if error is None:
+                stats.completed += 1
+            else:
+                stats.failed += 1
+            if transport:
+                stats.consecutive_failures += 1
+            else:
+                # The shard answered, so its channel is working
+                stats.consecutive_failures = 0
+
+        if error is None:
+            loop.call_soon_threadsafe(_resolve, future, result, None)
+        else:
+            loop.call_soon_threadsafe(_resolve, future, None, TeamError(f"Shard {shard_id}: {error}"))
+
+    def _mark_dead(self, shard_id: int) -> None:
+        """Flag a shard as dead and fail everything still waiting on it"""
+        stats = self.stats.get(shard_id)
+        if stats is None or not stats.alive:
+            return
+        stats.alive = False
+        if not self._stopping:
+            self.logger.error(f"Shard {shard_id} is no longer reachable")
+
+        with self._pending_lock:
+            orphaned = [rid for rid, entry in self._pending.items() if entry[2] == shard_id]
+        for request_id in orphaned:
+            self._complete(request_id, None, error="worker process exited", transport=True)
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[Exception]) -> None:
+    if future.done():
+        return
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
+
+
+class RemoteAgent:
+    """In-process proxy for a member agent hosted on a worker shard"""
+
+    def __init__(self, team: "ShardedAgentTeam", agent_id: str, config: AgentConfig):
+        self.team = team
+        self.agent_id = agent_id
+        self.config = config
+        self.name = config.name
+
+    @property
+    def shard_id(self) -> int:
+        return self.team.placement[self.agent_id]
+
+    @monitor(name="RemoteAgent.process")
+    async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        shard_id = self.shard_id
+        if not self.team.pool.is_healthy(shard_id):
+            shard_id = self.team.relocate(self.agent_id)
+        return await self.team.pool.submit(shard_id, self.agent_id, input_data, self.timeout)
+
+    @property
+    def timeout(self) -> float:
+        """Deadline for one subtask on the hosting shard"""
+        shard_config = self.team.shard_config
+        if shard_config.request_timeout is not None:
+            return shard_config.request_timeout
+        return self.config.timeout + shard_config.request_margin
+
+    def _trace_context(self) -> Dict[str, Any]:
+        """Context attached to spans opened by this proxy"""
+        return {"agent": self.name, "shard": self.team.placement.get(self.agent_id)}
+
+
+class ShardedAgentTeam(AgentTeam):
+    """AgentTeam whose member agents run across a pool of worker processes
+
+    The coordinator, task queue and admission control stay in this process;
+    subtasks are framed over pipes to the shard hosting the target agent.
+    Agents are placed on the least-loaded healthy shard and are moved when
+    their shard dies or keeps failing.
+    """
+
+    def __init__(
+        self,
+        config: TeamConfig,
+        shard_config: Optional[ShardConfig] = None,
+        system_monitor: Optional[SystemMonitor] = None
+    ):
+        self.shard_config = shard_config or ShardConfig()
+        self.pool = ShardPool(self.shard_config)
+        self.placement: Dict[str, int] = {}
+        super().__init__(config, system_monitor)
+
+    def _initialize(self):
+        """Create the coordinator locally and proxies for remote members"""
+        coordinator_config = AgentConfig(
+            name=f"{self.config.name}_coordinator",
+            capabilities=["coordination", "planning"]
+        )
+        self.coordinator = self.shard_config.agent_factory(coordinator_config)
+
+        for agent_id in self.config.member_agents:
+            agent_config = AgentConfig(
+                name=f"{self.config.name}_{agent_id}",
+                capabilities=["execution", "collaboration"]
+            )
+            self.agents[agent_id] = RemoteAgent(self, agent_id, agent_config)
+
+    async def start(self):
+        """Start worker processes and place member agents"""
+        await super().start()
+        await asyncio.to_thread(self.pool.start)
+        for agent_id in self.agents:
+            self._place(agent_id)
+
+    async def stop(self):
+        """Stop worker processes"""
+        await asyncio.to_thread(self.pool.stop)
+        await super().stop()
+
+    def relocate(self, agent_id: str) -> int:
+        """Move an agent off its current shard onto the least-loaded healthy one"""
+        previous = self.placement.get(agent_id)
+        if previous is not None:
+            self.pool.retire_agent(previous, agent_id)
+        return self._place(agent_id, exclude=() if previous is None else (previous,))
+
+    def shard_status(self) -> Dict[int, Dict[str, Any]]:
+        """Per-shard health and load"""
+        return {
+            shard_id: {**asdict(stats), "healthy": self.pool.is_healthy(shard_id)}
+            for shard_id, stats in self.pool.stats.items()
+        }
+
+    def _place(self, agent_id: str, exclude: Iterable[int] = ()) -> int:
+        shard_id = self.pool.least_loaded(exclude)
+        self.pool.spawn_agent(shard_id, agent_id, self.agents[agent_id].config)
+        self.placement[agent_id] = shard_id
+        return shard_id
+
+    def _select_agent_for_subtask(self, subtask: Dict[str, Any]) -> str:
+        """Prefer the agent whose shard currently has the lowest load"""
+        healthy = set(self.pool.healthy_shards())
+        candidates = [a for a, s in self.placement.items() if s in healthy]
+        if not candidates:
+            return super()._select_agent_for_subtask(subtask)
+        return min(candidates, key=lambda a: self.pool.stats[self.placement[a]].load)
@@ -4,10 +4,16 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import asyncio
 from datetime import datetime
+import uuid
 
 from .agent import Agent, AgentConfig
+from .admission import (
+    AdmissionConfig, AdmissionController, AdmissionDecision, AdmissionRejected, SHED
+)
 from ..utils.error_handling import TeamError
 from ..utils.monitoring import monitor
+from ..utils.system_monitor import SystemMonitor
+from ..utils.tracing import tracer
 
 @dataclass
 class TeamConfig:
@@ -16,15 +22,25 @@ class TeamConfig:
     member_agents: List[str]
     max_concurrent_tasks: int = 5
     collaboration_mode: str = "parallel"  # or "sequential"
+    admission: Optional[AdmissionConfig] = None
 
 class AgentTeam:
     """Manages a team of collaborative agents"""
     
-    def __init__(self, config: TeamConfig):
+    def __init__(self, config: TeamConfig, system_monitor: Optional[SystemMonitor] = None):
         self.config = config
         self.agents: Dict[str, Agent] = {}
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        admission_config = config.admission or AdmissionConfig()
+        if system_monitor is None and admission_config.use_host_metrics:
+            system_monitor = SystemMonitor()
+        self.system_monitor = system_monitor
+        self._owns_monitor = False
+        self._reserved_slots = 0  # Admitted tasks still being planned
+        self.admission = AdmissionController(admission_config, system_monitor)
+        self.task_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.admission.config.max_queue_depth
+        )
         self._initialize()
 
     def _initialize(self):
@@ -44,12 +60,45 @@ class AgentTeam:
             )
             self.agents[agent_id] = Agent(agent_config)
 
+    async def start(self):
+        """Start the system monitor that feeds admission control"""
+        await self._ensure_monitor()
+
+    async def _ensure_monitor(self):
+        """Start the system monitor if needed and wait for its first sample"""
+        monitor = self.system_monitor
+        if monitor is None:
+            return
+        if not monitor.running:
+            await monitor.start()
+            self._owns_monitor = True
+        await monitor.wait_for_sample()
+
+    async def stop(self):
+        """Stop the system monitor if this team started it"""
+        if self._owns_monitor:
+            await self.system_monitor.stop()
+            self._owns_monitor = False
+
     @monitor
     async def assign_task(self, task: Dict[str, Any]) -> str:
-        """Assign new task to team"""
+        """Assign new task to team
+
+        Raises AdmissionRejected, carrying a retry-after hint, when the
+        task is deferred or shed because the host or queue is overloaded.
+        The system monitor is started on first use if start() was not called.
+        """
+        await self._ensure_monitor()
+        decision = self.check_admission(task)
+        if not decision.admitted:
+            raise AdmissionRejected(decision)
+
+        # Hold a queue slot while planning so concurrent admissions cannot overfill it
+        self._reserved_slots += 1
         try:
             # Generate task ID
             task_id = self._generate_task_id()
+            tracer.set_context(task_id=task_id)
             
             # Create task context
             task_context = {
@@ -57,22 +106,38 @@ class AgentTeam:
                 "status": "pending",
                 "task": task,
                 "assigned_agents": [],
-                "timestamp": datetime.utcnow()
+                "timestamp": datetime.utcnow(),
+                # Execution runs in a worker task; this keeps it in the same trace
+                "trace": tracer.current_context()
             }
             
             # Plan task execution
             execution_plan = await self._plan_execution(task_context)
             task_context["execution_plan"] = execution_plan
             
-            # Add to task queue
-            await self.task_queue.put(task_context)
+            # Add to task queue; never wait for space
+            self.task_queue.put_nowait(task_context)
             self.active_tasks[task_id] = task_context
             
             return task_id
             
+        except asyncio.QueueFull:
+            decision = self.admission.reject(SHED, "task queue is full", 1.0)
+            self.admission.stats[SHED] += 1
+            raise AdmissionRejected(decision)
         except Exception as e:
             raise TeamError(f"Failed to assign task: {str(e)}")
+        finally:
+            self._reserved_slots -= 1
+
+    def check_admission(self, task: Dict[str, Any]) -> AdmissionDecision:
+        """Evaluate admission for a task without enqueuing it"""
+        return self.admission.evaluate(
+            priority=task.get("priority", 1),
+            queue_depth=self.task_queue.qsize() + self._reserved_slots
+        )
 
+    @monitor(name="AgentTeam.plan_execution")
     async def _plan_execution(self, task_context: Dict[str, Any]) -> Dict[str, Any]:
         """Plan task execution using coordinator agent"""
         planning_input = {
@@ -94,10 +159,15 @@ class AgentTeam:
             task_context = await self.task_queue.get()
             
             try:
-                if self.config.collaboration_mode == "parallel":
-                    await self._execute_parallel(task_context)
-                else:
-                    await self._execute_sequential(task_context)
+                with tracer.span(
+                    "AgentTeam.execute_task",
+                    {"task_id": task_context["id"]},
+                    parent=task_context.get("trace")
+                ):
+                    if self.config.collaboration_mode == "parallel":
+                        await self._execute_parallel(task_context)
+                    else:
+                        await self._execute_sequential(task_context)
                     
             except Exception as e:
                 task_context["status"] = "failed"
@@ -144,9 +214,18 @@ class AgentTeam:
     async def _execute_subtask(self, subtask: Dict[str, Any], agent_id: str) -> Dict[str, Any]:
         """Execute single subtask using specified agent"""
         agent = self.agents[agent_id]
-        return await agent.process(subtask)
+        with tracer.span("AgentTeam.execute_subtask", agent_id=agent_id):
+            return await agent.process(subtask)
+
+    def _trace_context(self) -> Dict[str, Any]:
+        """Context attached to spans opened by this team"""
+        return {"team": self.config.name}
 
     def _select_agent_for_subtask(self, subtask: Dict[str, Any]) -> str:
         """Select appropriate agent for subtask based on capabilities"""
         # Implement agent selection logic
-        return list(self.agents.keys())[0]  # Placeholder
\ No newline at end of file
+        return list(self.agents.keys())[0]  # Placeholder
+
+    def _generate_task_id(self) -> str:
+        """Generate unique task ID"""
+        return f"task_{uuid.uuid4().hex}"
@@ -0,0 +1,202 @@
+"""Fixed-size metrics history for Agentic OS
+Stores system samples in preallocated NumPy ring buffers with rollups."""
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Column layout shared by every ring buffer
+METRIC_COLUMNS: Tuple[str, ...] = (
+    "cpu_percent",
+    "memory_percent",
+    "disk_usage",
+    "net_sent_rate",
+    "net_recv_rate",
+)
+
+# Rollup levels: name -> bucket width in seconds
+DEFAULT_RESOLUTIONS: Dict[str, float] = {
+    "1m": 60.0,
+    "1h": 3600.0,
+}
+
+
+class MetricsRingBuffer:
+    """Fixed-capacity ring of timestamped metric rows
+
+    Rows are written in timestamp order, so the logical (oldest-first)
+    view is always sorted and window lookups can binary-search it.
+    """
+
+    def __init__(self, capacity: int, columns: Tuple[str, ...] = METRIC_COLUMNS):
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+
+        self.capacity = capacity
+        self.columns = columns
+        self._column_index = {name: i for i, name in enumerate(columns)}
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros((capacity, len(columns)), dtype=np.float64)
+        self._head = 0  # Next slot to write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the buffer arrays"""
+        return self._timestamps.nbytes + self._values.nbytes
+
+    def append(self, timestamp: float, values: np.ndarray) -> None:
+        """Write a row, overwriting the oldest one when full"""
+        self._timestamps[self._head] = timestamp
+        self._values[self._head] = values
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def latest(self) -> Optional[Tuple[float, np.ndarray]]:
+        """Get the most recent row"""
+        if not self._size:
+            return None
+        index = (self._head - 1) % self.capacity
+        return float(self._timestamps[index]), self._values[index].copy()
+
+    def oldest_timestamp(self) -> Optional[float]:
+        """Get the timestamp of the oldest retained row"""
+        if not self._size:
+            return None
+        return float(self._timestamps[(self._head - self._size) % self.capacity])
+
+    def window(self, since: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (timestamps, values) for rows with timestamp >= since"""
+        timestamps, values = self._ordered()
+        start = int(np.searchsorted(timestamps, since, side="left"))
+        return timestamps[start:], values[start:]
+
+    def column(self, name: str) -> int:
+        """Resolve a metric name to its column index"""
+        try:
+            return self._column_index[name]
+        except KeyError:
+            raise ValueError(f"Unknown metric: {name}")
+
+    def _ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Oldest-first view of the stored rows"""
+        if self._size < self.capacity:
+            return self._timestamps[:self._size], self._values[:self._size]
+        if self._head == 0:
+            return self._timestamps, self._values
+        order = np.r_[self._head:self.capacity, 0:self._head]
+        return self._timestamps[order], self._values[order]
+
+
+class _RollupAccumulator:
+    """Running mean for the bucket currently being filled"""
+
+    def __init__(self, width: float, n_columns: int):
+        self.width = width
+        self.bucket: Optional[int] = None
+        self.sums = np.zeros(n_columns, dtype=np.float64)
+        self.count = 0
+
+    def add(self, timestamp: float, values: np.ndarray) -> Optional[Tuple[float, np.ndarray]]:
+        """Add a sample; returns the finished bucket when one closes"""
+        bucket = int(timestamp // self.width)
+        finished = None
+
+        if self.bucket is not None and bucket != self.bucket and self.count:
+            finished = (self.bucket * self.width, self.sums / self.count)
+            self.sums = np.zeros_like(self.sums)
+            self.count = 0
+
+        self.bucket = bucket
+        self.sums += values
+        self.count += 1
+        return finished
+
+
+class MultiResolutionHistory:
+    """Raw samples plus coarser rollups, each in its own ring buffer
+
+    Memory is fixed at construction: the raw ring holds the most recent
+    samples and each rollup ring holds bucket means over a longer horizon.
+    """
+
+    def __init__(
+        self,
+        raw_capacity: int = 3600,
+        rollup_capacity: Optional[Dict[str, int]] = None,
+        resolutions: Optional[Dict[str, float]] = None,
+        columns: Tuple[str, ...] = METRIC_COLUMNS,
+    ):
+        self.columns = columns
+        self.resolutions = dict(resolutions or DEFAULT_RESOLUTIONS)
+        rollup_capacity = rollup_capacity or {"1m": 1440, "1h": 24 * 90}
+
+        self.raw = MetricsRingBuffer(raw_capacity, columns)
+        self.rollups: Dict[str, MetricsRingBuffer] = {}
+        self._accumulators: Dict[str, _RollupAccumulator] = {}
+        for name, width in sorted(self.resolutions.items(), key=lambda x: x[1]):
+            self.rollups[name] = MetricsRingBuffer(rollup_capacity.get(name, 1440), columns)
+            self._accumulators[name] = _RollupAccumulator(width, len(columns))
+
+    @property
+    def nbytes(self) -> int:
+        """Total memory held by all ring buffers"""
+        return self.raw.nbytes + sum(ring.nbytes for ring in self.rollups.values())
+
+    def record(self, timestamp: float, values: np.ndarray) -> None:
+        """Record a raw sample and feed the rollups"""
+        values = np.asarray(values, dtype=np.float64)
+        self.raw.append(timestamp, values)
+
+        for name, accumulator in self._accumulators.items():
+            finished = accumulator.add(timestamp, values)
+            if finished is not None:
+                self.rollups[name].append(*finished)
+
+    def latest(self) -> Optional[Tuple[float, np.ndarray]]:
+        """Get the most recent raw sample"""
+        return self.raw.latest()
+
+    def select(self, window_seconds: float, now: float) -> MetricsRingBuffer:
+        """Pick the finest ring that still covers the requested window"""
+        since = now - window_seconds
+        candidates: List[MetricsRingBuffer] = [self.raw] + list(self.rollups.values())
+
+        for ring in candidates:
+            oldest = ring.oldest_timestamp()
+            if oldest is not None and oldest <= since:
+                return ring
+
+        # Nothing reaches back far enough; use the ring with the longest span
+        spans = [
+            (now - ring.oldest_timestamp(), ring)
+            for ring in candidates
+            if ring.oldest_timestamp() is not None
+        ]
+        if not spans:
+            return self.raw
+        return max(spans, key=lambda x: x[0])[1]
+
+    def window_values(self, metric: str, window_seconds: float, now: float) -> np.ndarray:
+        """Get values of one metric over the last window_seconds"""
+        ring = self.select(window_seconds, now)
+        _, values = ring.window(now - window_seconds)
+        return values[:, ring.column(metric)]
+
+    def mean(self, metric: str, window_seconds: float, now: float) -> Optional[float]:
+        """Mean of a metric over the last window_seconds"""
+        values = self.window_values(metric, window_seconds, now)
+        if not values.size:
+            return None
+        return float(values.mean())
+
+    def percentile(
+        self, metric: str, q: float, window_seconds: float, now: float
+    ) -> Optional[float]:
+        """q-th percentile of a metric over the last window_seconds"""
+        values = self.window_values(metric, window_seconds, now)
+        if not values.size:
+            return None
+        return float(np.percentile(values, q))
@@ -0,0 +1,61 @@
+"""Monitoring decorators for Agentic OS
+Wraps hot-path methods in tracing spans."""
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import functools
+
+from .tracing import tracer
+
+
+def _context_of(args: tuple) -> Optional[Dict[str, Any]]:
+    """Propagated context from the bound instance, if it provides one"""
+    if args:
+        trace_context = getattr(args[0], "_trace_context", None)
+        if trace_context is not None:
+            return trace_context()
+    return None
+
+
+def monitor(func: Optional[Callable] = None, *, name: Optional[str] = None) -> Callable:
+    """Trace each call to the decorated function as a span
+
+    Usable as ``@monitor`` or ``@monitor(name="...")``. The span is named
+    after the function's qualified name unless overridden. Instances may
+    define ``_trace_context()`` returning context (agent, capability, ...)
+    that is attached to the span and inherited by nested spans.
+    """
+    if func is None:
+        return functools.partial(monitor, name=name)
+
+    span_name = name or func.__qualname__
+
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            span, token = tracer.enter(span_name, _context_of(args))
+            error = None
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                tracer.exit(span, token, error)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+        span, token = tracer.enter(span_name, _context_of(args))
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            tracer.exit(span, token, error)
+    return wrapper
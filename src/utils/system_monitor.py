@@ -1,12 +1,18 @@
 """System monitoring utilities for Agentic OS
 Provides resource tracking and system health monitoring."""
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import math
 import psutil
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
+import numpy as np
+
+from .metrics_history import METRIC_COLUMNS, MultiResolutionHistory
+
 @dataclass
 class SystemMetrics:
     """System resource metrics"""
@@ -19,10 +25,37 @@ class SystemMetrics:
 class SystemMonitor:
     """Monitors system resources and health"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        sample_interval: float = 1.0,
+        history_capacity: int = 3600,
+        rollup_capacity: Optional[Dict[str, int]] = None,
+        resource_interval: float = 5.0,
+        connections_interval: float = 30.0
+    ):
         self.logger = logging.getLogger("system_monitor")
-        self._metrics_history: List[SystemMetrics] = []
+        self.sample_interval = sample_interval
+        self.resource_interval = resource_interval
+        self.connections_interval = connections_interval
+        self.history = MultiResolutionHistory(
+            raw_capacity=history_capacity,
+            rollup_capacity=rollup_capacity
+        )
+        self._latest: Optional[SystemMetrics] = None
+        self._latest_at: Optional[float] = None
+        self._last_net: Optional[Dict[str, int]] = None
+        self._last_net_time: Optional[float] = None
+        # (value, time.monotonic() when collected), published as one reference
+        self._resource_snapshot: Optional[Tuple[Dict[str, Any], float]] = None
+        self._connection_count: Optional[Tuple[int, float]] = None
+        self._tasks: List[asyncio.Task] = []
+        self._first_sample: Optional[asyncio.Event] = None
         self._started = False
+        self._cpu_primed = False
+
+    @property
+    def running(self) -> bool:
+        return self._started
 
     async def start(self):
         """Start system monitoring"""
@@ -30,6 +63,17 @@ class SystemMonitor:
             return
 
         self._started = True
+        self._first_sample = asyncio.Event()
+        self._prime_cpu_percent()
+        self._tasks = [
+            asyncio.create_task(self._sample_loop()),
+            asyncio.create_task(self._collector_loop(
+                self._refresh_resource_snapshot, self.resource_interval
+            )),
+            asyncio.create_task(self._collector_loop(
+                self._refresh_connection_count, self.connections_interval
+            ))
+        ]
         self.logger.info("System monitoring started")
 
     async def stop(self):
@@ -38,30 +82,137 @@ class SystemMonitor:
             return
 
         self._started = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
         self.logger.info("System monitoring stopped")
 
+    async def wait_for_sample(self):
+        """Wait until the running sampler has attempted its first sample"""
+        if self._started and self._first_sample is not None:
+            await self._first_sample.wait()
+
+    async def _sample_loop(self):
+        """Record a sample every sample_interval seconds"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        while True:
+            try:
+                self.record(await asyncio.to_thread(self._collect_metrics))
+            except Exception as e:
+                self.logger.error(f"Sampling failed: {str(e)}")
+            self._first_sample.set()  # Even on failure, so waiters are not stuck
+
+            # Schedule against a fixed grid so sampling cost does not drift
+            next_tick += self.sample_interval
+            now = loop.time()
+            if next_tick < now:
+                # Fell behind (e.g. a stalled event loop): skip the missed grid
+                # points instead of recording a burst of back-to-back samples
+                missed = math.ceil((now - next_tick) / self.sample_interval)
+                next_tick += missed * self.sample_interval
+            await asyncio.sleep(max(0.0, next_tick - now))
+
+    async def _collector_loop(self, collector, interval: float):
+        """Run a blocking collector in a worker thread every interval seconds"""
+        while True:
+            try:
+                await asyncio.to_thread(collector)
+            except Exception as e:
+                self.logger.error(f"Collector {collector.__name__} failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def record(self, metrics: SystemMetrics) -> None:
+        """Write a sample into the history ring buffers"""
+        timestamp = metrics.timestamp
+        if timestamp.tzinfo is None:
+            # Naive values are UTC here; .timestamp() would read them as local time
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        now = timestamp.timestamp()
+        sent_rate, recv_rate = self._network_rates(metrics.network_io, now)
+
+        self.history.record(now, np.array([
+            metrics.cpu_percent,
+            metrics.memory_percent,
+            metrics.disk_usage,
+            sent_rate,
+            recv_rate
+        ]))
+        self._latest = metrics
+        self._latest_at = now
+
+    def _network_rates(self, network_io: Dict[str, int], now: float) -> tuple:
+        """Convert cumulative network counters into bytes/second"""
+        sent_rate = recv_rate = 0.0
+        if self._last_net is not None and now > self._last_net_time:
+            elapsed = now - self._last_net_time
+            sent_rate = max(0, network_io["bytes_sent"] - self._last_net["bytes_sent"]) / elapsed
+            recv_rate = max(0, network_io["bytes_recv"] - self._last_net["bytes_recv"]) / elapsed
+
+        self._last_net = network_io
+        self._last_net_time = now
+        return sent_rate, recv_rate
+
+    def _collect_metrics(self) -> SystemMetrics:
+        """Read current metrics from psutil"""
+        return SystemMetrics(
+            cpu_percent=psutil.cpu_percent(),
+            memory_percent=psutil.virtual_memory().percent,
+            disk_usage=psutil.disk_usage('/').percent,
+            network_io=dict(psutil.net_io_counters()._asdict()),
+            timestamp=datetime.fromtimestamp(time.time(), tz=timezone.utc)
+        )
+
     async def get_metrics(self) -> SystemMetrics:
         """Get current system metrics"""
         try:
-            metrics = SystemMetrics(
-                cpu_percent=psutil.cpu_percent(),
-                memory_percent=psutil.virtual_memory().percent,
-                disk_usage=psutil.disk_usage('/').percent,
-                network_io=dict(psutil.net_io_counters()._asdict()),
-                timestamp=datetime.utcnow()
-            )
-            
-            self._metrics_history.append(metrics)
-            return metrics
-            
+            return self._collect_metrics()
         except Exception as e:
             self.logger.error(f"Failed to get system metrics: {str(e)}")
             raise
 
+    def get_latest_metrics(self) -> SystemMetrics:
+        """Get the most recent sample, collecting a fresh one if it is out of date
+
+        While the sampler runs it keeps the sample current; otherwise (or if
+        it has stalled for two intervals) a sample is collected on demand.
+        """
+        max_age = self.sample_interval * (2 if self._started else 1)
+        if self._latest_at is None or time.time() - self._latest_at > max_age:
+            self.record(self._collect_metrics())
+        return self._latest
+
+    def get_recent_metrics(self, max_age: float) -> Optional[SystemMetrics]:
+        """Most recent sample if it is at most max_age seconds old, else None"""
+        if self._latest_at is None or time.time() - self._latest_at > max_age:
+            return None
+        return self._latest
+
+    def get_window_mean(self, metric: str, window_seconds: float) -> Optional[float]:
+        """Mean of a metric over the last window_seconds"""
+        return self.history.mean(metric, window_seconds, time.time())
+
+    def get_window_percentile(self, metric: str, q: float, window_seconds: float) -> Optional[float]:
+        """q-th percentile of a metric over the last window_seconds"""
+        return self.history.percentile(metric, q, window_seconds, time.time())
+
+    def get_window_stats(self, window_seconds: float) -> Dict[str, Dict[str, Optional[float]]]:
+        """Mean and p95 of every tracked metric over the last window_seconds"""
+        now = time.time()
+        return {
+            metric: {
+                "mean": self.history.mean(metric, window_seconds, now),
+                "p95": self.history.percentile(metric, 95, window_seconds, now)
+            }
+            for metric in METRIC_COLUMNS
+        }
+
     def get_health_status(self) -> Dict[str, Any]:
         """Get system health status"""
         try:
-            metrics = self.get_metrics()
+            metrics = self.get_latest_metrics()
             
             # Define health thresholds
             cpu_threshold = 80
@@ -103,26 +254,84 @@ class SystemMonitor:
                 "timestamp": datetime.utcnow()
             }
 
+    def _prime_cpu_percent(self) -> None:
+        """Take the reference reading that non-blocking cpu_percent calls diff against"""
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._cpu_primed = True
+
+    def _refresh_resource_snapshot(self) -> None:
+        """Collect detailed resource usage and publish it as the cached snapshot"""
+        # psutil keeps the previous reading process-wide, so a non-blocking call
+        # reports usage since the last call from anywhere; an unprimed first call
+        # would be all zeros, so the one-off fallback blocks for a short interval
+        interval = None if self._cpu_primed else 0.1
+        cpu_percent = psutil.cpu_percent(interval=interval, percpu=True)
+        self._cpu_primed = True
+        frequency = psutil.cpu_freq()
+        disk_io = psutil.disk_io_counters()
+        snapshot = {
+            "cpu": {
+                "percent": cpu_percent,
+                "count": psutil.cpu_count(),
+                "frequency": dict(frequency._asdict()) if frequency else None
+            },
+            "memory": dict(psutil.virtual_memory()._asdict()),
+            "disk": {
+                "usage": dict(psutil.disk_usage('/')._asdict()),
+                "io": dict(disk_io._asdict()) if disk_io else None
+            },
+            "network": {
+                "io": dict(psutil.net_io_counters()._asdict())
+            },
+            "timestamp": datetime.utcnow()
+        }
+
+        # One tuple assignment, so readers never pair a snapshot with another's age
+        self._resource_snapshot = (snapshot, time.monotonic())
+
+    def _refresh_connection_count(self) -> None:
+        """Count open network connections (expensive on busy hosts)"""
+        self._connection_count = (len(psutil.net_connections()), time.monotonic())
+
     def get_resource_usage(self) -> Dict[str, Any]:
-        """Get detailed resource usage information"""
+        """Get detailed resource usage from the latest cached snapshot
+
+        Collectors refresh the snapshot in worker threads while the monitor
+        is running; this call only copies it and reports its age in seconds.
+        When the monitor is not running, out-of-date parts are collected here.
+        """
         try:
-            return {
-                "cpu": {
-                    "percent": psutil.cpu_percent(interval=1, percpu=True),
-                    "count": psutil.cpu_count(),
-                    "frequency": dict(psutil.cpu_freq()._asdict())
-                },
-                "memory": dict(psutil.virtual_memory()._asdict()),
-                "disk": {
-                    "usage": dict(psutil.disk_usage('/')._asdict()),
-                    "io": dict(psutil.disk_io_counters()._asdict())
-                },
-                "network": {
-                    "io": dict(psutil.net_io_counters()._asdict()),
-                    "connections": len(psutil.net_connections())
-                },
-                "timestamp": datetime.utcnow()
-            }
+            resource = self._resource_snapshot
+            connections = self._connection_count
+            if not self._started:
+                now = time.monotonic()
+                if resource is None or now - resource[1] > self.resource_interval:
+                    self._refresh_resource_snapshot()
+                    resource = self._resource_snapshot
+                if connections is None or now - connections[1] > self.connections_interval:
+                    try:
+                        self._refresh_connection_count()
+                        connections = self._connection_count
+                    except Exception as e:
+                        # Often needs privileges; the rest of the snapshot is still useful
+                        self.logger.warning(f"Failed to count connections: {str(e)}")
+            elif resource is None:
+                self._refresh_resource_snapshot()
+                resource = self._resource_snapshot
+
+            cached, collected_at = resource
+            now = time.monotonic()
+            snapshot = dict(cached)
+            snapshot["network"] = dict(snapshot["network"])
+            if connections is None:
+                snapshot["network"]["connections"] = None
+                snapshot["network"]["connections_staleness"] = None
+            else:
+                snapshot["network"]["connections"] = connections[0]
+                snapshot["network"]["connections_staleness"] = now - connections[1]
+            snapshot["staleness"] = now - collected_at
+            return snapshot
         except Exception as e:
             self.logger.error(f"Failed to get resource usage: {str(e)}")
-            raise"
+            raise
@@ -0,0 +1,295 @@
+"""Tracing utilities for Agentic OS
+Records nested timing spans across asyncio tasks and exports Chrome traces."""
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import threading
+import time
+
+_BUCKETS_PER_OCTAVE = 8  # ~9% relative resolution for histogram percentiles
+_MAX_LANES = 4096  # Bound on distinct trace tracks kept for export
+
+
+class SpanContext(NamedTuple):
+    """Detached reference to a span, for parenting work that runs in another task"""
+    trace_id: int
+    span_id: int
+    sampled: bool
+    context: Dict[str, Any]
+
+
+class Span:
+    """A single timed operation within a trace"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "context", "attributes",
+        "sampled", "start_ns", "end_ns", "lane",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: int,
+        span_id: int,
+        parent_id: Optional[int],
+        context: Dict[str, Any],
+        sampled: bool,
+        lane: int
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.context = context  # Propagated to child spans
+        self.attributes: Dict[str, Any] = {}  # This span only
+        self.sampled = sampled
+        self.lane = lane
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def span_context(self) -> SpanContext:
+        return SpanContext(self.trace_id, self.span_id, self.sampled, self.context)
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+
+    def to_chrome_event(self, pid: int) -> Dict[str, Any]:
+        """Render as a Chrome trace 'complete' event"""
+        args = dict(self.context)
+        args.update(self.attributes)
+        args.update(trace_id=self.trace_id, span_id=self.span_id, parent_id=self.parent_id)
+        return {
+            "name": self.name,
+            "cat": self.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": self.start_ns / 1000,
+            "dur": self.duration_ns / 1000,
+            "pid": pid,
+            "tid": self.lane,
+            "args": {k: v if isinstance(v, (str, int, float, bool)) or v is None else str(v) for k, v in args.items()},
+        }
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with constant memory"""
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        index = int(math.log2(duration_ns) * _BUCKETS_PER_OCTAVE) if duration_ns > 0 else 0
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile in nanoseconds (bucket upper bound)"""
+        if not self.count:
+            return 0.0
+        target = q / 100.0 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(2 ** ((index + 1) / _BUCKETS_PER_OCTAVE), self.max_ns)
+        return float(self.max_ns)
+
+    def summary(self) -> Dict[str, float]:
+        """Latency summary in milliseconds"""
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p95_ms": self.percentile(95) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Creates spans, keeps sampled ones in a bounded buffer, and aggregates latency
+
+    Sampling is decided once per trace at the root span and inherited by
+    its children. Latency histograms are updated for every span, sampled
+    or not, so in-process statistics stay exact while exports stay small.
+    Only 1% of traces are kept by default; raise sample_rate with
+    configure() before capturing a trace for export.
+    """
+
+    def __init__(self, sample_rate: float = 0.01, max_spans: int = 10_000, enabled: bool = True):
+        self.sample_rate = sample_rate
+        self.enabled = enabled
+        self.spans: deque = deque(maxlen=max_spans)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._ids = itertools.count(1)
+        self._lanes: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        sample_rate: Optional[float] = None,
+        max_spans: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ) -> None:
+        """Update tracer settings at runtime"""
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if max_spans is not None:
+            self.spans = deque(self.spans, maxlen=max_spans)
+        if enabled is not None:
+            self.enabled = enabled
+
+    def start_span(
+        self,
+        name: str,
+        context: Optional[Dict[str, Any]] = None,
+        parent: Optional[Union[Span, SpanContext]] = None
+    ) -> Span:
+        """Create a span as a child of parent, or of the current span (does not make it current)"""
+        if parent is None:
+            parent = _current_span.get()
+        if parent is None:
+            trace_id = next(self._ids)
+            sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+            merged = dict(context) if context else {}
+            parent_id = None
+        else:
+            trace_id = parent.trace_id
+            sampled = parent.sampled
+            merged = {**parent.context, **context} if context else parent.context
+            parent_id = parent.span_id
+
+        # Lanes only matter for export, so skip the lookup for unsampled spans
+        lane = self._lane() if sampled else 0
+        return Span(name, trace_id, next(self._ids), parent_id, merged, sampled, lane)
+
+    def end_span(self, span: Span) -> None:
+        """Close a span and record its latency"""
+        span.end_ns = time.perf_counter_ns()
+        histogram = self.histograms.get(span.name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(span.name, LatencyHistogram())
+        histogram.record(span.end_ns - span.start_ns)
+        if span.sampled:
+            self.spans.append(span)
+
+    def enter(
+        self,
+        name: str,
+        context: Optional[Dict[str, Any]] = None,
+        parent: Optional[Union[Span, SpanContext]] = None
+    ) -> Tuple[Span, Token]:
+        """Open a span and make it current; pair with exit()"""
+        span = self.start_span(name, context, parent)
+        return span, _current_span.set(span)
+
+    def exit(self, span: Span, token: Token, error: Optional[BaseException] = None) -> None:
+        """Restore the previous span and close this one"""
+        if error is not None:
+            span.attributes["error"] = type(error).__name__
+        _current_span.reset(token)
+        self.end_span(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        context: Optional[Dict[str, Any]] = None,
+        parent: Optional[Union[Span, SpanContext]] = None,
+        **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        """Trace a block; context is inherited by child spans, attributes are not"""
+        if not self.enabled:
+            yield None
+            return
+
+        span, token = self.enter(name, context, parent)
+        if attributes:
+            span.attributes.update(attributes)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.exit(span, token, error)
+
+    def set_context(self, **context: Any) -> None:
+        """Add propagated context (e.g. task_id) to the current span"""
+        span = _current_span.get()
+        if span is not None:
+            span.context = {**span.context, **context}
+
+    def annotate(self, **attributes: Any) -> None:
+        """Add attributes to the current span only"""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def current_context(self) -> Optional[SpanContext]:
+        """Reference to the current span that can be handed to another task"""
+        span = _current_span.get()
+        return span.span_context if span is not None else None
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-span-name latency statistics"""
+        return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write sampled spans as Chrome trace / Perfetto JSON; returns event count"""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [span.to_chrome_event(pid) for span in list(self.spans)]
+        events.sort(key=lambda e: e["ts"])
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+        return len(events)
+
+    def reset(self) -> None:
+        """Drop recorded spans and histograms"""
+        self.spans.clear()
+        self.histograms.clear()
+        self._lanes.clear()
+
+    def _lane(self) -> int:
+        """Small integer per asyncio task (or thread) so concurrent work gets its own track"""
+        try:
+            key = id(asyncio.current_task())
+        except RuntimeError:
+            key = threading.get_ident()
+
+        lane = self._lanes.get(key)
+        if lane is None:
+            with self._lock:
+                if len(self._lanes) >= _MAX_LANES:
+                    self._lanes.clear()
+                lane = self._lanes.setdefault(key, len(self._lanes) + 1)
+        return lane
+
+
+tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return tracer
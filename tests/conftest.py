@@ -3,6 +3,10 @@ import asyncio
 from typing import Dict, Any
 from unittest.mock import MagicMock
 
+# Stand in for support modules missing from this tree (memory, processing, ...)
+from benchmarks import stubs
+stubs.install()
+
 from src.core.agent import Agent, AgentConfig
 from src.core.capabilities import Capability, CapabilityMetadata
 from src.core.memory import Memory
@@ -0,0 +1,160 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from benchmarks import stubs
+from src.core import team as team_module
+from src.core.admission import (
+    ADMIT, DEFER, SHED, AdmissionConfig, AdmissionController, AdmissionRejected
+)
+from src.core.team import AgentTeam, TeamConfig
+from src.utils.system_monitor import SystemMonitor
+
+
+class FakeMonitor:
+    """Monitor whose readings the test sets directly"""
+
+    def __init__(self, memory: float = 0.0, cpu: float = 0.0, fresh: bool = True):
+        self.memory = memory
+        self.cpu = cpu
+        self.fresh = fresh
+
+    def get_recent_metrics(self, max_age: float):
+        if not self.fresh:
+            return None
+        return SimpleNamespace(memory_percent=self.memory, cpu_percent=self.cpu)
+
+    def get_window_mean(self, metric: str, window_seconds: float):
+        return self.cpu
+
+
+def _controller(monitor=None, **overrides) -> AdmissionController:
+    return AdmissionController(AdmissionConfig(**overrides), monitor)
+
+
+def test_admits_when_idle():
+    decision = _controller(FakeMonitor()).evaluate(priority=1, queue_depth=0)
+    assert decision.admitted
+    assert decision.pressure == 0.0
+
+
+def test_throttles_low_priority_between_watermarks():
+    controller = _controller(FakeMonitor(memory=85.0))
+    assert controller.evaluate(priority=0, queue_depth=0).action == DEFER
+    assert controller.evaluate(priority=1, queue_depth=0).action == ADMIT
+
+
+def test_overload_defers_normal_and_sheds_lowest_priority():
+    controller = _controller(FakeMonitor(cpu=96.0))
+    assert controller.evaluate(priority=1, queue_depth=0).action == DEFER
+    assert controller.evaluate(priority=0, queue_depth=0).action == SHED
+    assert controller.evaluate(priority=3, queue_depth=0).action == ADMIT
+    assert controller.stats == {ADMIT: 1, DEFER: 1, SHED: 1}
+
+
+def test_hard_limits_shed_even_critical_tasks():
+    assert _controller(FakeMonitor(memory=98.0)).evaluate(3, 0).action == SHED
+    assert _controller(max_queue_depth=10).evaluate(3, 10).action == SHED
+
+
+def test_overload_has_hysteresis():
+    monitor = FakeMonitor(memory=95.0)
+    controller = _controller(monitor)
+    assert controller.evaluate(1, 0).action == DEFER
+
+    # Back between the watermarks: still overloaded until pressure reaches 0
+    monitor.memory = 85.0
+    assert controller.overloaded
+    assert controller.evaluate(1, 0).action == DEFER
+
+    monitor.memory = 70.0
+    assert controller.evaluate(1, 0).action == ADMIT
+    assert not controller.overloaded
+
+
+def test_retry_after_grows_with_pressure_and_is_capped():
+    controller = _controller(max_retry_after=5.0)
+    assert controller.reject(DEFER, "", 0.0).retry_after == 1.0
+    assert controller.reject(DEFER, "", 1.0).retry_after == 2.0
+    assert controller.reject(SHED, "", 1.0).retry_after == 5.0
+
+
+def test_stale_metrics_are_ignored():
+    controller = _controller(FakeMonitor(memory=99.0, fresh=False))
+    assert controller.evaluate(1, 0).admitted
+
+
+def test_unstarted_monitor_never_serves_frozen_readings():
+    monitor = SystemMonitor()
+    monitor.record(monitor._collect_metrics())
+    assert monitor.get_recent_metrics(max_age=5.0) is not None
+
+    monitor._latest_at -= 60
+    assert monitor.get_recent_metrics(max_age=5.0) is None
+
+
+def _team(monitor=None, **admission) -> AgentTeam:
+    config = TeamConfig(
+        name="test",
+        coordinator_agent="coordinator",
+        member_agents=["a", "b"],
+        admission=AdmissionConfig(**admission),
+    )
+    with mock.patch.object(team_module, "Agent", stubs.StubAgent):
+        return AgentTeam(config, monitor)
+
+
+async def test_team_lifecycle_starts_and_stops_monitor():
+    monitor = SystemMonitor(sample_interval=0.01)
+    team = _team(monitor)
+    await team.start()
+    assert monitor.running
+    await asyncio.sleep(0.05)
+    assert monitor.get_recent_metrics(team.admission.config.max_metrics_age) is not None
+
+    await team.stop()
+    assert not monitor.running
+
+
+async def test_queue_capacity_counts_tasks_still_being_planned():
+    team = _team(
+        queue_low_watermark=100, queue_high_watermark=200, max_queue_depth=2, use_host_metrics=False
+    )
+    release = asyncio.Event()
+    plan = team._plan_execution
+
+    async def slow_plan(task_context):
+        await release.wait()
+        return await plan(task_context)
+
+    team._plan_execution = slow_plan
+    pending = [asyncio.create_task(team.assign_task({"task": "execute"})) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # Both slots are reserved by tasks in planning, so this is shed up front
+    with pytest.raises(AdmissionRejected):
+        await team.assign_task({"task": "execute"})
+    assert team.admission.stats[SHED] == 1
+
+    release.set()
+    await asyncio.gather(*pending)
+    assert team.task_queue.qsize() == 2
+
+
+async def test_default_team_monitors_host_from_first_task():
+    team = _team()
+    assert isinstance(team.system_monitor, SystemMonitor)
+    assert not team.system_monitor.running
+
+    await team.assign_task({"task": "execute", "priority": 3})
+    try:
+        assert team.system_monitor.running
+        assert team.system_monitor.get_recent_metrics(team.admission.config.max_metrics_age) is not None
+    finally:
+        await team.stop()
+
+
+def test_host_metrics_can_be_disabled():
+    assert _team(use_host_metrics=False).system_monitor is None
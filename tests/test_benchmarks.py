@@ -0,0 +1,52 @@
+import json
+
+from benchmarks import run
+from benchmarks.harness import BENCHMARKS, BenchmarkResult, benchmark
+
+
+def _result(min_s: float, params=None):
+    return {"params": params or {"n": 1}, "min_s": min_s, "median_s": min_s}
+
+
+def test_compare_flags_only_regressions_past_threshold():
+    baseline = {"fast": _result(0.100), "slow": _result(0.100), "new_params": _result(0.1, {"n": 2})}
+    results = {"fast": _result(0.110), "slow": _result(0.200), "new_params": _result(1.0), "unknown": _result(1.0)}
+
+    regressions = run.compare(results, baseline, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow")
+
+
+def test_compare_ignores_jitter_below_min_delta():
+    baseline = {"tiny": _result(0.0001)}
+    assert run.compare({"tiny": _result(0.0003)}, baseline, 0.5, min_delta=0.001) == []
+    assert run.compare({"tiny": _result(0.0003)}, baseline, 0.5) != []
+
+
+def test_result_summary_uses_sorted_timings():
+    summary = BenchmarkResult("b", {}, [0.3, 0.1, 0.2]).to_dict()
+    assert (summary["min_s"], summary["median_s"], summary["p95_s"]) == (0.1, 0.2, 0.3)
+
+
+def test_gate_fails_on_regression(tmp_path, monkeypatch):
+    calls = []
+
+    @benchmark("test.gate", profiles={"quick": {"n": 1}}, repeats=2)
+    async def gate(params):
+        async def run_once():
+            calls.append(params["n"])
+        return run_once
+
+    try:
+        baseline = tmp_path / "baseline.json"
+        args = ["--filter", "test.gate", "--output", str(tmp_path / "out.json"), "--baseline", str(baseline)]
+        assert run.main(args + ["--require-baseline"]) == 1
+        assert run.main(args + ["--update-baseline"]) == 0
+        assert len(calls) == 6  # Warm-up plus two repeats, per run
+
+        document = json.loads(baseline.read_text())
+        document["results"]["test.gate"]["min_s"] = 1e-9
+        baseline.write_text(json.dumps(document))
+        assert run.main(args + ["--min-delta", "0"]) == 1
+    finally:
+        BENCHMARKS.pop("test.gate", None)
@@ -0,0 +1,168 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from benchmarks import stubs
+from src.core.embedding_store import EmbeddingStore
+from src.core.knowledge_base import KnowledgeBase, KnowledgeEntry
+from src.utils.error_handling import KnowledgeBaseError
+
+
+class GatedEmbedder(stubs.HashEmbedder):
+    """HashEmbedder that can be held mid-await to interleave other calls"""
+
+    def __init__(self, dimension: int):
+        super().__init__(dimension)
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.waiting = asyncio.Event()
+
+    async def __call__(self, text: str) -> np.ndarray:
+        self.waiting.set()
+        await self.gate.wait()
+        return await super().__call__(text)
+
+
+@pytest.fixture
+def kb():
+    kb = KnowledgeBase(embedding_dimension=32, compaction_min_dead=4)
+    kb._generate_embedding = GatedEmbedder(32)
+    return kb
+
+
+async def _fill(kb, n: int, category: str = "errors"):
+    return [
+        await kb.add_entry(f"service failure report ERR-{i:04d}", category, "test")
+        for i in range(n)
+    ]
+
+
+async def _while_embedding(kb, coro, action):
+    """Run coro until it awaits the embedder, apply action, then let it finish"""
+    embedder = kb._generate_embedding
+    embedder.gate.clear()
+    embedder.waiting.clear()
+    pending = asyncio.create_task(coro)
+    await embedder.waiting.wait()
+    await action()
+    embedder.gate.set()
+    return await pending
+
+
+def test_store_tombstones_and_compacts_in_chunks():
+    store = EmbeddingStore(dimension=4, initial_capacity=2)
+    for i in range(10):
+        store.add(f"e{i}", np.eye(4)[i % 4] + 0.01 * i)
+    for i in range(0, 10, 2):
+        assert store.delete(f"e{i}")
+    assert not store.delete("e0")
+    assert (store.live_count, store.dead_count) == (5, 5)
+
+    expected = {f"e{i}": store.get(f"e{i}") for i in range(1, 10, 2)}
+    while not store.compact_step(chunk=3):
+        # Valid between steps: every live entry is still found
+        assert {entry_id for entry_id, _ in store.search(np.ones(4), 10)} == set(expected)
+
+    assert store.dead_count == 0
+    for entry_id, vector in expected.items():
+        np.testing.assert_array_equal(store.get(entry_id), vector)
+
+
+def test_store_similarities_skip_deleted_entries():
+    store = EmbeddingStore(dimension=2)
+    store.add("a", np.array([1.0, 0.0]))
+    store.add("b", np.array([0.0, 1.0]))
+    store.delete("b")
+    assert store.similarities(np.array([1.0, 0.0]), ["a", "b"]) == {"a": pytest.approx(1.0)}
+
+
+async def test_entries_read_their_embedding_from_the_store(kb):
+    entry_id = (await _fill(kb, 1))[0]
+    entry = kb.entries[entry_id]
+    assert entry._embedding is None  # No second copy next to the store's row
+    np.testing.assert_array_equal(entry.embedding, kb.get_embedding(entry_id))
+    assert entry.embedding.dtype == np.float32
+    assert kb.get_embedding("missing") is None
+
+    await kb.update_entry(entry_id, content="replacement text")
+    np.testing.assert_array_equal(entry.embedding, kb.get_embedding(entry_id))
+    with pytest.raises(AttributeError):
+        entry.embedding = np.zeros(32)
+
+
+def test_entries_can_still_be_built_with_an_embedding():
+    vector = np.ones(4)
+    entry = KnowledgeEntry(
+        id="e", content="c", embedding=vector, metadata={},
+        timestamp=datetime.utcnow(), category="c", source="s"
+    )
+    assert entry.embedding is vector
+
+
+async def test_delete_removes_entry_from_every_query_mode(kb):
+    ids = await _fill(kb, 5)
+    assert await kb.delete_entry(ids[2])
+    assert not await kb.delete_entry(ids[2])
+
+    for mode in ("vector", "lexical", "hybrid"):
+        results = await kb.query("ERR-0002 failure", top_k=10, mode=mode)
+        assert ids[2] not in {result["id"] for result in results}
+    assert ids[2] not in kb.get_category_entries("errors")
+
+
+async def test_update_reindexes_content_and_category(kb):
+    entry_id = (await _fill(kb, 3))[0]
+    await kb.update_entry(entry_id, content="disk quota exceeded", category="storage")
+
+    lexical = await kb.query("quota", mode="lexical")
+    assert [result["id"] for result in lexical] == [entry_id]
+    assert entry_id not in {result["id"] for result in await kb.query("ERR-0000", mode="lexical")}
+    assert entry_id in kb.get_category_entries("storage")
+    assert entry_id not in kb.get_category_entries("errors")
+
+
+async def test_update_racing_delete_leaves_no_ghost(kb):
+    entry_id = (await _fill(kb, 2))[0]
+
+    async def delete():
+        await kb.delete_entry(entry_id)
+
+    with pytest.raises(KnowledgeBaseError, match="deleted during update"):
+        await _while_embedding(kb, kb.update_entry(entry_id, content="new text"), delete)
+
+    assert entry_id not in kb.lexical_index
+    assert entry_id not in kb.embedding_store
+    assert not await kb.query("new text", mode="lexical")
+
+
+async def test_hybrid_query_racing_delete_skips_deleted_entry(kb):
+    ids = await _fill(kb, 5)
+
+    async def delete():
+        await kb.delete_entry(ids[1])
+
+    results = await _while_embedding(kb, kb.query("ERR-0001", mode="hybrid"), delete)
+    assert ids[1] not in {result["id"] for result in results}
+
+
+async def test_background_compaction_reclaims_rows(kb):
+    ids = await _fill(kb, 12)
+    for entry_id in ids[:8]:
+        await kb.delete_entry(entry_id)
+
+    task = kb._compaction_task
+    assert task is not None
+    await task
+
+    metrics = kb.get_storage_metrics()
+    assert metrics["live_entries"] == 4
+    assert metrics["dead_rows"] == 0
+    assert metrics["index_tombstones"] == 0
+    assert metrics["compactions"] == 1
+    assert metrics["rows_reclaimed"] == 8
+    assert kb.index["errors"] == ids[8:]
+
+    results = await kb.query("ERR-0010", mode="hybrid", top_k=1)
+    assert results[0]["id"] == ids[10]
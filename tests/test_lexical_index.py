@@ -0,0 +1,79 @@
+import pytest
+
+from benchmarks import stubs
+from src.core.knowledge_base import KnowledgeBase
+from src.core.lexical_index import InvertedIndex, tokenize
+from src.utils.error_handling import KnowledgeBaseError
+
+
+@pytest.fixture
+def index():
+    index = InvertedIndex()
+    index.add("d1", "Timeout talking to payments service ERR-0042")
+    index.add("d2", "payments service restarted after deploy")
+    index.add("d3", "cache warmed; no errors ERR-0007")
+    index.add("d4", "payments payments payments retry storm")
+    return index
+
+
+def test_tokenize_keeps_identifiers_whole_and_split():
+    assert tokenize("Upstream ERR-0042 at api/v2") == [
+        "upstream", "err-0042", "err", "0042", "at", "api/v2", "api", "v2"
+    ]
+
+
+def test_exact_identifier_ranks_its_document_first(index):
+    assert [doc_id for doc_id, _ in index.search("ERR-0042")] == ["d1"]
+
+
+def test_unknown_identifier_falls_back_to_its_parts(index):
+    # ERR-9999 is not indexed whole, so it matches on 'err'
+    assert {doc_id for doc_id, _ in index.search("ERR-9999")} == {"d1", "d3"}
+
+
+def test_bm25_rewards_rare_terms_and_saturates_frequency(index):
+    scores = dict(index.search("payments deploy", top_k=10))
+    assert set(scores) == {"d1", "d2", "d4"}
+    # 'deploy' is rarer than 'payments', and tf saturates for d4
+    assert scores["d2"] > scores["d4"] > scores["d1"]
+
+
+def test_no_match_returns_nothing(index):
+    assert index.search("kubernetes") == []
+    assert InvertedIndex().search("anything") == []
+
+
+def test_remove_drops_postings_and_lengths(index):
+    index.remove("d1", "Timeout talking to payments service ERR-0042")
+    assert "d1" not in index
+    assert "err-0042" not in index.postings
+    assert "timeout" not in index.postings
+    assert len(index.postings["payments"]) == 2
+    assert "d1" not in dict(index.search("ERR-0042"))
+
+    # Removing twice is a no-op
+    index.remove("d1", "Timeout talking to payments service ERR-0042")
+    assert len(index) == 3
+
+
+async def test_lexical_and_hybrid_modes_find_exact_identifiers():
+    kb = KnowledgeBase(embedding_dimension=32)
+    kb._generate_embedding = stubs.HashEmbedder(32)
+    ids = [
+        await kb.add_entry(f"worker crashed with code ERR-{i:04d}", "errors", "test")
+        for i in range(20)
+    ]
+
+    for mode in ("lexical", "hybrid"):
+        results = await kb.query("ERR-0013", top_k=3, mode=mode)
+        assert results[0]["id"] == ids[13]
+
+    lexical = await kb.query("ERR-0013", mode="lexical")
+    assert lexical[0]["similarity"] is None
+    hybrid = await kb.query("ERR-0013", mode="hybrid")
+    assert hybrid[0]["similarity"] is not None
+
+
+async def test_unknown_mode_is_rejected():
+    with pytest.raises(KnowledgeBaseError):
+        await KnowledgeBase(embedding_dimension=8).query("x", mode="fuzzy")
@@ -0,0 +1,193 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from benchmarks import stubs
+from src.core.admission import AdmissionConfig
+from src.core.sharding import RESULT, RUN, FrameCodec, ShardConfig, ShardedAgentTeam, msgpack
+from src.core.team import TeamConfig
+from src.utils.error_handling import TeamError
+
+
+class PickyAgent(stubs.StubAgent):
+    """Stub agent that misbehaves on request: bad input, hangs, blocking work"""
+
+    async def process(self, input_data):
+        if input_data.get("bad"):
+            raise ValueError("bad input")
+        if input_data.get("hang"):
+            await asyncio.Event().wait()
+        if input_data.get("block"):
+            time.sleep(input_data["block"])  # Stalls the shard's event loop
+        if input_data.get("unencodable"):
+            return {"status": "success", "when": datetime(2024, 1, 1), "call": lambda: None}
+        return await super().process(input_data)
+
+
+def make_picky_agent(config):
+    return PickyAgent(config, median_latency=0.001)
+
+
+def _team(workers: int = 2, **shard_options) -> ShardedAgentTeam:
+    config = TeamConfig(
+        name="sharded",
+        coordinator_agent="coordinator",
+        member_agents=[f"agent_{i}" for i in range(4)],
+        admission=AdmissionConfig(use_host_metrics=False),
+    )
+    return ShardedAgentTeam(
+        config,
+        ShardConfig(
+            workers=workers,
+            # Fork so workers inherit the stubs installed by conftest
+            start_method="fork",
+            agent_factory=make_picky_agent,
+            **shard_options
+        ),
+    )
+
+
+@pytest.fixture
+async def team():
+    team = _team()
+    await team.start()
+    yield team
+    await team.stop()
+
+
+@pytest.mark.parametrize("name", ["pickle", pytest.param("msgpack", marks=pytest.mark.skipif(
+    msgpack is None, reason="msgpack not installed"))])
+def test_codec_round_trips_frames(name):
+    codec = FrameCodec(name)
+    frame = (RUN, 7, ["agent_0", {"task": "execute", "parameters": {"n": 1}}])
+    assert tuple(codec.loads(codec.dumps(frame))) == frame
+
+
+def test_msgpack_codec_rejects_unknown_types():
+    if msgpack is None:
+        with pytest.raises(TeamError):
+            FrameCodec("msgpack")
+        return
+    with pytest.raises(TypeError):
+        FrameCodec("msgpack").dumps((RESULT, 1, {"when": datetime(2024, 1, 1)}))
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(TeamError):
+        FrameCodec("json")
+
+
+async def test_subtasks_run_on_worker_shards(team):
+    results = await asyncio.gather(*(
+        agent.process({"task": "execute"}) for agent in team.agents.values()
+    ))
+    assert all(result["status"] == "success" for result in results)
+    assert sum(stats.completed for stats in team.pool.stats.values()) == 4
+
+
+async def test_agent_errors_do_not_mark_shard_unhealthy(team):
+    agent = team.agents["agent_0"]
+    shard_id = agent.shard_id
+    limit = team.shard_config.max_consecutive_failures
+
+    for _ in range(limit + 2):
+        with pytest.raises(TeamError, match="bad input"):
+            await agent.process({"bad": True})
+
+    stats = team.pool.stats[shard_id]
+    assert stats.failed == limit + 2
+    assert stats.consecutive_failures == 0
+    assert team.pool.is_healthy(shard_id)
+    assert agent.shard_id == shard_id
+
+
+async def test_failing_shard_recovers_after_probe():
+    team = _team(probe_interval=0.0)
+    await team.start()
+    try:
+        stats = team.pool.stats[0]
+        stats.consecutive_failures = team.shard_config.max_consecutive_failures
+        assert 0 not in team.pool.healthy_shards()  # Sends the probe
+
+        deadline = time.monotonic() + 5
+        while stats.consecutive_failures and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert team.pool.is_healthy(0)
+    finally:
+        await team.stop()
+
+
+async def test_relocation_retires_agent_on_old_shard(team):
+    agent = team.agents["agent_0"]
+    previous = agent.shard_id
+    current = team.relocate("agent_0")
+    assert current != previous
+
+    # The old shard no longer hosts the agent
+    with pytest.raises(TeamError, match="KeyError"):
+        await team.pool.submit(previous, "agent_0", {"task": "execute"}, timeout=5.0)
+    assert (await agent.process({"task": "execute"}))["status"] == "success"
+
+
+async def test_agents_fail_over_when_a_worker_dies(team):
+    victim = team.placement["agent_0"]
+    process = team.pool._processes[victim]
+    process.kill()
+    process.join()
+
+    deadline = time.monotonic() + 5
+    while team.pool.stats[victim].alive and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    assert not team.pool.is_healthy(victim)
+
+    result = await team.agents["agent_0"].process({"task": "execute"})
+    assert result["status"] == "success"
+    assert team.placement["agent_0"] != victim
+
+
+async def test_unencodable_results_fail_the_request(team):
+    agent = team.agents["agent_0"]
+    with pytest.raises(TeamError):
+        await agent.process({"unencodable": True})
+    assert team.pool.is_healthy(agent.shard_id)
+
+
+async def test_hung_request_fails_at_its_deadline():
+    team = _team(request_timeout=0.2, stop_timeout=0.5)
+    await team.start()
+    try:
+        agent = team.agents["agent_0"]
+        shard_id = agent.shard_id
+        with pytest.raises(TeamError, match="no reply"):
+            await agent.process({"hang": True})
+
+        stats = team.pool.stats[shard_id]
+        assert stats.in_flight == 0
+        assert stats.consecutive_failures == 1
+        assert stats.failed == 1
+    finally:
+        await team.stop()
+
+
+async def test_stalled_shard_is_probed_and_leaves_rotation():
+    team = _team(probe_interval=0.1)
+    await team.start()
+    try:
+        agent = team.agents["agent_0"]
+        shard_id = agent.shard_id
+        blocked = asyncio.create_task(agent.process({"block": 1.0}))
+        await asyncio.sleep(0.2)
+
+        team.pool.healthy_shards()  # In flight and silent: sends a probe
+        assert team.pool.stats[shard_id].probe_sent is not None
+        await asyncio.sleep(0.2)
+        assert not team.pool.is_healthy(shard_id)
+
+        # Once the loop unblocks, the result and the PONG restore it
+        assert (await blocked)["status"] == "success"
+        await asyncio.sleep(0.05)
+        assert team.pool.is_healthy(shard_id)
+    finally:
+        await team.stop()
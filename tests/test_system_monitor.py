@@ -0,0 +1,209 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.utils.metrics_history import MetricsRingBuffer, MultiResolutionHistory
+from src.utils.system_monitor import SystemMonitor, SystemMetrics
+
+
+def _row(value: float) -> np.ndarray:
+    return np.full(5, value, dtype=float)
+
+
+@pytest.fixture
+def tz():
+    """Switch the process time zone for one test"""
+    original = os.environ.get("TZ")
+
+    def set_tz(name: str):
+        os.environ["TZ"] = name
+        time.tzset()
+
+    yield set_tz
+
+    if original is None:
+        os.environ.pop("TZ", None)
+    else:
+        os.environ["TZ"] = original
+    time.tzset()
+
+
+def test_ring_buffer_overwrites_oldest_rows():
+    ring = MetricsRingBuffer(capacity=4)
+    for t in range(10):
+        ring.append(float(t), _row(t))
+
+    assert len(ring) == 4
+    timestamps, values = ring.window(0.0)
+    assert timestamps.tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert values[:, 0].tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert ring.latest()[0] == 9.0
+    assert ring.oldest_timestamp() == 6.0
+
+
+def test_ring_buffer_window_uses_timestamps():
+    ring = MetricsRingBuffer(capacity=8)
+    for t in range(12):
+        ring.append(float(t), _row(t))
+
+    timestamps, _ = ring.window(9.5)
+    assert timestamps.tolist() == [10.0, 11.0]
+
+
+def test_ring_buffer_rejects_unknown_metric():
+    with pytest.raises(ValueError):
+        MetricsRingBuffer(capacity=2).column("gpu")
+
+
+def test_rollups_store_bucket_means():
+    history = MultiResolutionHistory(raw_capacity=10)
+    for t in range(180):
+        history.record(float(t), _row(t))
+
+    minutes = history.rollups["1m"]
+    timestamps, values = minutes.window(0.0)
+    # Third minute is still open, so only two buckets are closed
+    assert timestamps.tolist() == [0.0, 60.0]
+    assert values[:, 0].tolist() == [29.5, 89.5]
+
+
+def test_window_queries_fall_back_to_coarser_rings():
+    history = MultiResolutionHistory(raw_capacity=100)
+    for t in range(20000):
+        history.record(float(t), _row(t % 100))
+
+    now = 20000.0
+    assert history.select(50, now) is history.raw
+    assert history.select(7200, now) is history.rollups["1m"]
+    assert history.mean("cpu_percent", 50, now) == pytest.approx(74.5)
+    assert history.percentile("cpu_percent", 95, 50, now) is not None
+
+
+def test_memory_is_fixed_after_construction():
+    history = MultiResolutionHistory(raw_capacity=50)
+    before = history.nbytes
+    for t in range(100000):
+        history.record(float(t), _row(1.0))
+    assert history.nbytes == before
+
+
+def test_empty_window_returns_none():
+    history = MultiResolutionHistory(raw_capacity=10)
+    assert history.mean("cpu_percent", 60, time.time()) is None
+
+
+@pytest.mark.parametrize("zone", ["Asia/Tokyo", "America/New_York", "UTC"])
+def test_recorded_samples_are_in_window_in_any_time_zone(tz, zone):
+    tz(zone)
+    monitor = SystemMonitor()
+    monitor.record(monitor._collect_metrics())
+
+    stored, _ = monitor.history.latest()
+    assert abs(stored - time.time()) < 5
+    assert monitor.get_window_mean("cpu_percent", 60) is not None
+
+
+def test_naive_timestamps_are_treated_as_utc(tz):
+    tz("Asia/Tokyo")
+    monitor = SystemMonitor()
+    monitor.record(SystemMetrics(1.0, 2.0, 3.0, {"bytes_sent": 0, "bytes_recv": 0}, datetime.utcnow()))
+
+    stored, _ = monitor.history.latest()
+    assert abs(stored - time.time()) < 5
+
+
+async def test_sampler_records_in_background():
+    monitor = SystemMonitor(sample_interval=0.01, history_capacity=16)
+    await monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    assert len(monitor.history.raw) >= 3
+    stats = monitor.get_window_stats(60)
+    assert set(stats) >= {"cpu_percent", "memory_percent"}
+    assert stats["memory_percent"]["mean"] is not None
+
+
+def test_health_status_reports_latest_sample():
+    status = SystemMonitor().get_health_status()
+    assert status["status"] in ("healthy", "warning")
+    assert set(status["metrics"]) == {"cpu", "memory", "disk"}
+
+
+async def test_start_primes_cpu_percent(monkeypatch):
+    monitor = SystemMonitor(sample_interval=60, resource_interval=60, connections_interval=60)
+    calls = []
+    monkeypatch.setattr(
+        "src.utils.system_monitor.psutil.cpu_percent",
+        lambda interval=None, percpu=False: calls.append((interval, percpu)) or ([1.0] if percpu else 1.0)
+    )
+    await monitor.start()
+    await monitor.stop()
+
+    assert calls[:2] == [(None, False), (None, True)]
+
+
+def test_resource_usage_is_served_from_cached_snapshot():
+    monitor = SystemMonitor()
+    first = monitor.get_resource_usage()
+    assert len(first["cpu"]["percent"]) == first["cpu"]["count"]
+    assert first["staleness"] >= 0
+    assert isinstance(first["network"]["connections"], int)
+
+    snapshot = monitor._resource_snapshot
+    monitor.get_resource_usage()
+    assert monitor._resource_snapshot is snapshot
+
+
+def test_unstarted_monitor_refreshes_old_snapshot():
+    monitor = SystemMonitor(resource_interval=5.0)
+    monitor.get_resource_usage()
+    snapshot, collected_at = monitor._resource_snapshot
+    monitor._resource_snapshot = (snapshot, collected_at - 10.0)
+
+    assert monitor.get_resource_usage()["staleness"] < 5.0
+
+
+def test_snapshot_and_its_age_are_published_together():
+    monitor = SystemMonitor()
+    monitor._refresh_resource_snapshot()
+    snapshot, collected_at = monitor._resource_snapshot
+    assert isinstance(snapshot, dict) and isinstance(collected_at, float)
+
+
+async def test_collectors_refresh_snapshot_in_background():
+    monitor = SystemMonitor(sample_interval=60, resource_interval=0.01, connections_interval=0.01)
+    await monitor.start()
+    await asyncio.sleep(0.2)
+    await monitor.stop()
+
+    usage = monitor.get_resource_usage()
+    assert usage["staleness"] < 1
+    assert usage["network"]["connections_staleness"] is not None
+
+
+def test_unstarted_monitor_collects_fresh_samples(monkeypatch):
+    monitor = SystemMonitor(sample_interval=1.0)
+    first = monitor.get_health_status()["timestamp"]
+    assert monitor.get_health_status()["timestamp"] == first  # Within one interval
+
+    monitor._latest_at -= 2.0
+    assert monitor.get_health_status()["timestamp"] > first
+
+
+async def test_sampler_skips_ticks_missed_during_a_stall():
+    monitor = SystemMonitor(sample_interval=0.05, history_capacity=64)
+    await monitor.start()
+    await asyncio.sleep(0.01)
+    time.sleep(0.5)  # Block the event loop for ten intervals
+    await asyncio.sleep(0.2)
+    await monitor.stop()
+
+    timestamps, _ = monitor.history.raw.window(0.0)
+    gaps = np.diff(timestamps)
+    assert len(timestamps) < 10
+    assert gaps.min() > 0.02
@@ -0,0 +1,143 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from benchmarks import stubs
+from src.core import team as team_module
+from src.core.admission import AdmissionConfig
+from src.core.team import AgentTeam, TeamConfig
+from src.utils.monitoring import monitor
+from src.utils.tracing import LatencyHistogram, Tracer, tracer
+
+
+@pytest.fixture
+def sampled():
+    """Record every trace on the process-wide tracer for one test"""
+    previous = tracer.sample_rate
+    tracer.reset()
+    tracer.configure(sample_rate=1.0)
+    yield tracer
+    tracer.configure(sample_rate=previous)
+    tracer.reset()
+
+
+def test_default_tracer_keeps_few_spans():
+    default = Tracer()
+    assert default.sample_rate < 0.1
+    assert default.spans.maxlen <= 10_000
+
+
+def test_spans_nest_and_inherit_context():
+    local = Tracer(sample_rate=1.0)
+    with local.span("outer", {"team": "t"}) as outer:
+        with local.span("inner", step=1) as inner:
+            pass
+
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_id == outer.span_id
+    assert inner.context == {"team": "t"}
+    assert inner.attributes == {"step": 1}
+    assert [span.name for span in local.spans] == ["inner", "outer"]
+
+
+def test_unsampled_traces_still_feed_histograms():
+    local = Tracer(sample_rate=0.0)
+    for _ in range(5):
+        with local.span("work"):
+            pass
+
+    assert not local.spans
+    assert local.latency_summary()["work"]["count"] == 5
+
+
+def test_errors_are_recorded_on_the_span():
+    local = Tracer(sample_rate=1.0)
+    with pytest.raises(ValueError):
+        with local.span("failing"):
+            raise ValueError("boom")
+    assert local.spans[0].attributes["error"] == "ValueError"
+
+
+def test_explicit_parent_links_work_across_tasks():
+    local = Tracer(sample_rate=1.0)
+
+    async def scenario():
+        with local.span("assign") as root:
+            local.set_context(task_id="t1")
+            link = local.current_context()
+
+        async def worker():
+            with local.span("execute", parent=link) as child:
+                return child
+
+        return root, await asyncio.create_task(worker())
+
+    root, child = asyncio.run(scenario())
+    assert child.trace_id == root.trace_id
+    assert child.parent_id == root.span_id
+    assert child.context["task_id"] == "t1"
+
+
+def test_histogram_percentiles_are_bounded_by_max():
+    histogram = LatencyHistogram()
+    for ns in (1_000, 2_000, 4_000, 1_000_000):
+        histogram.record(ns)
+    assert histogram.percentile(50) <= 2_000 * 1.1
+    assert histogram.percentile(100) == 1_000_000
+
+
+async def test_monitor_decorator_opens_spans(sampled):
+    class Worker:
+        def _trace_context(self):
+            return {"agent": "w"}
+
+        @monitor(name="Worker.run")
+        async def run(self):
+            return tracer.current_span()
+
+    span = await Worker().run()
+    assert span.name == "Worker.run"
+    assert span.context == {"agent": "w"}
+    assert sampled.latency_summary()["Worker.run"]["count"] == 1
+
+
+async def test_task_spans_share_one_trace(sampled):
+    config = TeamConfig(
+        name="traced",
+        coordinator_agent="coordinator",
+        member_agents=["a", "b"],
+        admission=AdmissionConfig(use_host_metrics=False),
+    )
+    with mock.patch.object(team_module, "Agent", stubs.StubAgent):
+        team = AgentTeam(config)
+
+    runner = asyncio.create_task(team.execute_tasks())
+    try:
+        task_id = await team.assign_task({"task": "execute"})
+        await team.task_queue.join()
+    finally:
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+    spans = {span.name: span for span in sampled.spans}
+    assign = spans["AgentTeam.assign_task"]
+    for name in ("AgentTeam.plan_execution", "AgentTeam.execute_task", "AgentTeam.execute_subtask"):
+        assert spans[name].trace_id == assign.trace_id
+        assert spans[name].context["task_id"] == task_id
+    assert spans["AgentTeam.execute_task"].parent_id == assign.span_id
+
+
+def test_chrome_export_writes_complete_events(tmp_path):
+    local = Tracer(sample_rate=1.0)
+    with local.span("outer", {"team": "t"}):
+        with local.span("inner"):
+            pass
+
+    path = tmp_path / "trace.json"
+    assert local.export_chrome_trace(str(path)) == 2
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert events[1]["args"]["parent_id"] == events[0]["args"]["span_id"]